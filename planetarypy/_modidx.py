@@ -112,7 +112,11 @@ d = { 'settings': { 'branch': 'master',
                                  'planetarypy.ctx.CTXCollection.__repr__': ('api/ctx.html#ctxcollection.__repr__', 'planetarypy/ctx.py'),
                                  'planetarypy.ctx.CTXCollection.__str__': ('api/ctx.html#ctxcollection.__str__', 'planetarypy/ctx.py'),
                                  'planetarypy.ctx.CTXCollection._do_calib': ('api/ctx.html#ctxcollection._do_calib', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.CTXCollection._do_download': ( 'api/ctx.html#ctxcollection._do_download',
+                                 'planetarypy.ctx.CTXCollection._index_volumes': ( 'api/ctx.html#ctxcollection._index_volumes',
+                                                                                   'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXCollection._volume_table': ( 'api/ctx.html#ctxcollection._volume_table',
+                                                                                  'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXCollection._worker_args': ( 'api/ctx.html#ctxcollection._worker_args',
                                                                                  'planetarypy/ctx.py'),
                                  'planetarypy.ctx.CTXCollection.by_month': ('api/ctx.html#ctxcollection.by_month', 'planetarypy/ctx.py'),
                                  'planetarypy.ctx.CTXCollection.by_volume': ('api/ctx.html#ctxcollection.by_volume', 'planetarypy/ctx.py'),
@@ -143,8 +147,12 @@ d = { 'settings': { 'branch': 'master',
                                  'planetarypy.ctx.CTXCollection.product_ids': ( 'api/ctx.html#ctxcollection.product_ids',
                                                                                 'planetarypy/ctx.py'),
                                  'planetarypy.ctx.CTXCollection.sample': ('api/ctx.html#ctxcollection.sample', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXCollection.source_paths': ( 'api/ctx.html#ctxcollection.source_paths',
+                                                                                 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXCollection.urls': ('api/ctx.html#ctxcollection.urls', 'planetarypy/ctx.py'),
                                  'planetarypy.ctx.CTXCollection.volume_from_pid': ( 'api/ctx.html#ctxcollection.volume_from_pid',
                                                                                     'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.CTXCollection.volumes': ('api/ctx.html#ctxcollection.volumes', 'planetarypy/ctx.py'),
                                  'planetarypy.ctx.CTXCollection.volumes_in_pids': ( 'api/ctx.html#ctxcollection.volumes_in_pids',
                                                                                     'planetarypy/ctx.py'),
                                  'planetarypy.ctx.CTXEDR': ('api/ctx.html#ctxedr', 'planetarypy/ctx.py'),
@@ -160,7 +168,8 @@ d = { 'settings': { 'branch': 'master',
                                  'planetarypy.ctx.CTXEDR.url': ('api/ctx.html#ctxedr.url', 'planetarypy/ctx.py'),
                                  'planetarypy.ctx.CTXEDR.volume': ('api/ctx.html#ctxedr.volume', 'planetarypy/ctx.py'),
                                  'planetarypy.ctx.ctx_calib': ('api/ctx.html#ctx_calib', 'planetarypy/ctx.py'),
-                                 'planetarypy.ctx.get_edr_index': ('api/ctx.html#get_edr_index', 'planetarypy/ctx.py')},
+                                 'planetarypy.ctx.get_edr_index': ('api/ctx.html#get_edr_index', 'planetarypy/ctx.py'),
+                                 'planetarypy.ctx.get_edr_meta': ('api/ctx.html#get_edr_meta', 'planetarypy/ctx.py')},
             'planetarypy.db': {},
             'planetarypy.diviner': { 'planetarypy.diviner.DataManager': ('api/diviner.html#datamanager', 'planetarypy/diviner.py'),
                                      'planetarypy.diviner.DataManager.__init__': ( 'api/diviner.html#datamanager.__init__',
@@ -411,6 +420,8 @@ d = { 'settings': { 'branch': 'master',
                                                                                          'planetarypy/hirise.py'),
                                     'planetarypy.hirise.RGB_NOMAPCollection.local_paths': ( 'api/hirise.html#rgb_nomapcollection.local_paths',
                                                                                             'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.RGB_NOMAPCollection.products': ( 'api/hirise.html#rgb_nomapcollection.products',
+                                                                                         'planetarypy/hirise.py'),
                                     'planetarypy.hirise.RedMosaic': ('api/hirise.html#redmosaic', 'planetarypy/hirise.py'),
                                     'planetarypy.hirise.RedMosaic.__init__': ( 'api/hirise.html#redmosaic.__init__',
                                                                                'planetarypy/hirise.py'),
@@ -453,11 +464,26 @@ d = { 'settings': { 'branch': 'master',
                                     'planetarypy.hirise.SOURCE_PRODUCT.stitched_cube_path': ( 'api/hirise.html#source_product.stitched_cube_path',
                                                                                               'planetarypy/hirise.py'),
                                     'planetarypy.hirise.SOURCE_PRODUCT.url': ( 'api/hirise.html#source_product.url',
-                                                                               'planetarypy/hirise.py')},
-            'planetarypy.pds.apps': { 'planetarypy.pds.apps.find_indexes': ('api/pds.apps.html#find_indexes', 'planetarypy/pds/apps.py'),
+                                                                               'planetarypy/hirise.py'),
+                                    'planetarypy.hirise._index_lookup': ('api/hirise.html#_index_lookup', 'planetarypy/hirise.py'),
+                                    'planetarypy.hirise._index_product_id': ('api/hirise.html#_index_product_id', 'planetarypy/hirise.py'),
+                                    'planetarypy.hirise.urls_exist': ('api/hirise.html#urls_exist', 'planetarypy/hirise.py')},
+            'planetarypy.pds.apps': { 'planetarypy.pds.apps._latest_index_url': ( 'api/pds.apps.html#_latest_index_url',
+                                                                                  'planetarypy/pds/apps.py'),
+                                      'planetarypy.pds.apps._local_timestamp': ( 'api/pds.apps.html#_local_timestamp',
+                                                                                 'planetarypy/pds/apps.py'),
+                                      'planetarypy.pds.apps._try': ('api/pds.apps.html#_try', 'planetarypy/pds/apps.py'),
+                                      'planetarypy.pds.apps.check_all_updates': ( 'api/pds.apps.html#check_all_updates',
+                                                                                  'planetarypy/pds/apps.py'),
+                                      'planetarypy.pds.apps.find_all_indexes': ( 'api/pds.apps.html#find_all_indexes',
+                                                                                 'planetarypy/pds/apps.py'),
+                                      'planetarypy.pds.apps.find_indexes': ('api/pds.apps.html#find_indexes', 'planetarypy/pds/apps.py'),
                                       'planetarypy.pds.apps.find_instruments': ( 'api/pds.apps.html#find_instruments',
                                                                                  'planetarypy/pds/apps.py'),
-                                      'planetarypy.pds.apps.get_index': ('api/pds.apps.html#get_index', 'planetarypy/pds/apps.py')},
+                                      'planetarypy.pds.apps.get_index': ('api/pds.apps.html#get_index', 'planetarypy/pds/apps.py'),
+                                      'planetarypy.pds.apps.pds_check_updates': ( 'api/pds.apps.html#pds_check_updates',
+                                                                                  'planetarypy/pds/apps.py'),
+                                      'planetarypy.pds.apps.prepare_index': ('api/pds.apps.html#prepare_index', 'planetarypy/pds/apps.py')},
             'planetarypy.pds.crism_index': { 'planetarypy.pds.crism_index.MTRDRIndex': ( 'api/pds.crism_index.html#mtrdrindex',
                                                                                          'planetarypy/pds/crism_index.py'),
                                              'planetarypy.pds.crism_index.MTRDRIndex.__init__': ( 'api/pds.crism_index.html#mtrdrindex.__init__',
@@ -472,6 +498,8 @@ d = { 'settings': { 'branch': 'master',
                                                                                                          'planetarypy/pds/ctx_index.py'),
                                            'planetarypy.pds.ctx_index.CTXIndex.latest_release_number': ( 'api/pds.ctx_index.html#ctxindex.latest_release_number',
                                                                                                          'planetarypy/pds/ctx_index.py'),
+                                           'planetarypy.pds.ctx_index.CTXIndex.volumes': ( 'api/pds.ctx_index.html#ctxindex.volumes',
+                                                                                           'planetarypy/pds/ctx_index.py'),
                                            'planetarypy.pds.ctx_index.CTXIndex.volumes_table': ( 'api/pds.ctx_index.html#ctxindex.volumes_table',
                                                                                                  'planetarypy/pds/ctx_index.py')},
             'planetarypy.pds.indexes': { 'planetarypy.pds.indexes.Index': ('api/pds.indexes.html#index', 'planetarypy/pds/indexes.py'),
@@ -481,10 +509,22 @@ d = { 'settings': { 'branch': 'master',
                                                                                      'planetarypy/pds/indexes.py'),
                                          'planetarypy.pds.indexes.Index.__str__': ( 'api/pds.indexes.html#index.__str__',
                                                                                     'planetarypy/pds/indexes.py'),
+                                         'planetarypy.pds.indexes.Index._convert_new_records': ( 'api/pds.indexes.html#index._convert_new_records',
+                                                                                                 'planetarypy/pds/indexes.py'),
+                                         'planetarypy.pds.indexes.Index._first_new_row': ( 'api/pds.indexes.html#index._first_new_row',
+                                                                                           'planetarypy/pds/indexes.py'),
+                                         'planetarypy.pds.indexes.Index._remote_last_offset': ( 'api/pds.indexes.html#index._remote_last_offset',
+                                                                                                'planetarypy/pds/indexes.py'),
+                                         'planetarypy.pds.indexes.Index._repair_record': ( 'api/pds.indexes.html#index._repair_record',
+                                                                                           'planetarypy/pds/indexes.py'),
+                                         'planetarypy.pds.indexes.Index._set_remote_last_offset': ( 'api/pds.indexes.html#index._set_remote_last_offset',
+                                                                                                    'planetarypy/pds/indexes.py'),
                                          'planetarypy.pds.indexes.Index.convert_to_parquet': ( 'api/pds.indexes.html#index.convert_to_parquet',
                                                                                                'planetarypy/pds/indexes.py'),
                                          'planetarypy.pds.indexes.Index.download': ( 'api/pds.indexes.html#index.download',
                                                                                      'planetarypy/pds/indexes.py'),
+                                         'planetarypy.pds.indexes.Index.incremental_update': ( 'api/pds.indexes.html#index.incremental_update',
+                                                                                               'planetarypy/pds/indexes.py'),
                                          'planetarypy.pds.indexes.Index.index_name': ( 'api/pds.indexes.html#index.index_name',
                                                                                        'planetarypy/pds/indexes.py'),
                                          'planetarypy.pds.indexes.Index.instrument': ( 'api/pds.indexes.html#index.instrument',
@@ -495,6 +535,8 @@ d = { 'settings': { 'branch': 'master',
                                                                                          'planetarypy/pds/indexes.py'),
                                          'planetarypy.pds.indexes.Index.isupper': ( 'api/pds.indexes.html#index.isupper',
                                                                                     'planetarypy/pds/indexes.py'),
+                                         'planetarypy.pds.indexes.Index.key_lookup': ( 'api/pds.indexes.html#index.key_lookup',
+                                                                                       'planetarypy/pds/indexes.py'),
                                          'planetarypy.pds.indexes.Index.key_tokens': ( 'api/pds.indexes.html#index.key_tokens',
                                                                                        'planetarypy/pds/indexes.py'),
                                          'planetarypy.pds.indexes.Index.label': ( 'api/pds.indexes.html#index.label',
@@ -509,20 +551,32 @@ d = { 'settings': { 'branch': 'master',
                                                                                             'planetarypy/pds/indexes.py'),
                                          'planetarypy.pds.indexes.Index.local_table_path': ( 'api/pds.indexes.html#index.local_table_path',
                                                                                              'planetarypy/pds/indexes.py'),
+                                         'planetarypy.pds.indexes.Index.lookup': ( 'api/pds.indexes.html#index.lookup',
+                                                                                   'planetarypy/pds/indexes.py'),
                                          'planetarypy.pds.indexes.Index.mission': ( 'api/pds.indexes.html#index.mission',
                                                                                     'planetarypy/pds/indexes.py'),
                                          'planetarypy.pds.indexes.Index.mission_key': ( 'api/pds.indexes.html#index.mission_key',
                                                                                         'planetarypy/pds/indexes.py'),
                                          'planetarypy.pds.indexes.Index.parquet': ( 'api/pds.indexes.html#index.parquet',
                                                                                     'planetarypy/pds/indexes.py'),
+                                         'planetarypy.pds.indexes.Index.parquet_part_paths': ( 'api/pds.indexes.html#index.parquet_part_paths',
+                                                                                               'planetarypy/pds/indexes.py'),
+                                         'planetarypy.pds.indexes.Index.parquet_paths': ( 'api/pds.indexes.html#index.parquet_paths',
+                                                                                          'planetarypy/pds/indexes.py'),
                                          'planetarypy.pds.indexes.Index.parse_key': ( 'api/pds.indexes.html#index.parse_key',
                                                                                       'planetarypy/pds/indexes.py'),
                                          'planetarypy.pds.indexes.Index.read_index_data': ( 'api/pds.indexes.html#index.read_index_data',
                                                                                             'planetarypy/pds/indexes.py'),
+                                         'planetarypy.pds.indexes.Index.read_parquet': ( 'api/pds.indexes.html#index.read_parquet',
+                                                                                         'planetarypy/pds/indexes.py'),
+                                         'planetarypy.pds.indexes.Index.record_fixups': ( 'api/pds.indexes.html#index.record_fixups',
+                                                                                          'planetarypy/pds/indexes.py'),
                                          'planetarypy.pds.indexes.Index.remote_timestamp': ( 'api/pds.indexes.html#index.remote_timestamp',
                                                                                              'planetarypy/pds/indexes.py'),
                                          'planetarypy.pds.indexes.Index.set_url': ( 'api/pds.indexes.html#index.set_url',
                                                                                     'planetarypy/pds/indexes.py'),
+                                         'planetarypy.pds.indexes.Index.sort_by': ( 'api/pds.indexes.html#index.sort_by',
+                                                                                    'planetarypy/pds/indexes.py'),
                                          'planetarypy.pds.indexes.Index.tab_extension': ( 'api/pds.indexes.html#index.tab_extension',
                                                                                           'planetarypy/pds/indexes.py'),
                                          'planetarypy.pds.indexes.Index.table_filename': ( 'api/pds.indexes.html#index.table_filename',
@@ -532,7 +586,11 @@ d = { 'settings': { 'branch': 'master',
                                          'planetarypy.pds.indexes.Index.update_available': ( 'api/pds.indexes.html#index.update_available',
                                                                                              'planetarypy/pds/indexes.py'),
                                          'planetarypy.pds.indexes.Index.update_timestamp': ( 'api/pds.indexes.html#index.update_timestamp',
-                                                                                             'planetarypy/pds/indexes.py')},
+                                                                                             'planetarypy/pds/indexes.py'),
+                                         'planetarypy.pds.indexes._last_record_offset': ( 'api/pds.indexes.html#_last_record_offset',
+                                                                                          'planetarypy/pds/indexes.py'),
+                                         'planetarypy.pds.indexes.latest_index_url': ( 'api/pds.indexes.html#latest_index_url',
+                                                                                       'planetarypy/pds/indexes.py')},
             'planetarypy.pds.lroc_index': { 'planetarypy.pds.lroc_index.LROCIndex': ( 'api/pds.lroc_index.html#lrocindex',
                                                                                       'planetarypy/pds/lroc_index.py'),
                                             'planetarypy.pds.lroc_index.LROCIndex.__init__': ( 'api/pds.lroc_index.html#lrocindex.__init__',
@@ -543,6 +601,8 @@ d = { 'settings': { 'branch': 'master',
                                                                                                             'planetarypy/pds/lroc_index.py'),
                                             'planetarypy.pds.lroc_index.LROCIndex.latest_release_number': ( 'api/pds.lroc_index.html#lrocindex.latest_release_number',
                                                                                                             'planetarypy/pds/lroc_index.py'),
+                                            'planetarypy.pds.lroc_index.LROCIndex.volumes': ( 'api/pds.lroc_index.html#lrocindex.volumes',
+                                                                                              'planetarypy/pds/lroc_index.py'),
                                             'planetarypy.pds.lroc_index.LROCIndex.volumes_table': ( 'api/pds.lroc_index.html#lrocindex.volumes_table',
                                                                                                     'planetarypy/pds/lroc_index.py')},
             'planetarypy.pds.opusapi': { 'planetarypy.pds.opusapi.OPUS': ('api/pds.opusapi.html#opus', 'planetarypy/pds/opusapi.py'),
@@ -609,14 +669,26 @@ d = { 'settings': { 'branch': 'master',
                                          'planetarypy.pds.opusapi.OPUSObsID.thumb_img_url': ( 'api/pds.opusapi.html#opusobsid.thumb_img_url',
                                                                                               'planetarypy/pds/opusapi.py')},
             'planetarypy.pds.utils': { 'planetarypy.pds.utils.IndexLabel': ('api/pds.utils.html#indexlabel', 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.IndexLabel.__getstate__': ( 'api/pds.utils.html#indexlabel.__getstate__',
+                                                                                          'planetarypy/pds/utils.py'),
                                        'planetarypy.pds.utils.IndexLabel.__init__': ( 'api/pds.utils.html#indexlabel.__init__',
                                                                                       'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.IndexLabel.arrow_schema': ( 'api/pds.utils.html#indexlabel.arrow_schema',
+                                                                                          'planetarypy/pds/utils.py'),
                                        'planetarypy.pds.utils.IndexLabel.colnames': ( 'api/pds.utils.html#indexlabel.colnames',
                                                                                       'planetarypy/pds/utils.py'),
                                        'planetarypy.pds.utils.IndexLabel.colspecs': ( 'api/pds.utils.html#indexlabel.colspecs',
                                                                                       'planetarypy/pds/utils.py'),
                                        'planetarypy.pds.utils.IndexLabel.columns_dic': ( 'api/pds.utils.html#indexlabel.columns_dic',
                                                                                          'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.IndexLabel.convert_to_parquet': ( 'api/pds.utils.html#indexlabel.convert_to_parquet',
+                                                                                                'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.IndexLabel.data_types': ( 'api/pds.utils.html#indexlabel.data_types',
+                                                                                        'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.IndexLabel.decoder': ( 'api/pds.utils.html#indexlabel.decoder',
+                                                                                     'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.IndexLabel.dtypes': ( 'api/pds.utils.html#indexlabel.dtypes',
+                                                                                    'planetarypy/pds/utils.py'),
                                        'planetarypy.pds.utils.IndexLabel.index_path': ( 'api/pds.utils.html#indexlabel.index_path',
                                                                                         'planetarypy/pds/utils.py'),
                                        'planetarypy.pds.utils.IndexLabel.pvl_columns': ( 'api/pds.utils.html#indexlabel.pvl_columns',
@@ -625,8 +697,35 @@ d = { 'settings': { 'branch': 'master',
                                                                                      'planetarypy/pds/utils.py'),
                                        'planetarypy.pds.utils.IndexLabel.read_index_data': ( 'api/pds.utils.html#indexlabel.read_index_data',
                                                                                              'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.IndexLabel.record_bytes': ( 'api/pds.utils.html#indexlabel.record_bytes',
+                                                                                          'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.IndexLabel.record_dtype': ( 'api/pds.utils.html#indexlabel.record_dtype',
+                                                                                          'planetarypy/pds/utils.py'),
                                        'planetarypy.pds.utils.IndexLabel.table': ( 'api/pds.utils.html#indexlabel.table',
                                                                                    'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.IndexLabel.time_columns': ( 'api/pds.utils.html#indexlabel.time_columns',
+                                                                                          'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.KeyLookup': ('api/pds.utils.html#keylookup', 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.KeyLookup.__init__': ( 'api/pds.utils.html#keylookup.__init__',
+                                                                                     'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.KeyLookup.build': ( 'api/pds.utils.html#keylookup.build',
+                                                                                  'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.KeyLookup.find': ( 'api/pds.utils.html#keylookup.find',
+                                                                                 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.KeyLookup.find_prefix': ( 'api/pds.utils.html#keylookup.find_prefix',
+                                                                                        'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.KeyLookup.get': ( 'api/pds.utils.html#keylookup.get',
+                                                                                'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.KeyLookup.is_current': ( 'api/pds.utils.html#keylookup.is_current',
+                                                                                       'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.KeyLookup.keys': ( 'api/pds.utils.html#keylookup.keys',
+                                                                                 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.KeyLookup.keys_path': ( 'api/pds.utils.html#keylookup.keys_path',
+                                                                                      'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.KeyLookup.read': ( 'api/pds.utils.html#keylookup.read',
+                                                                                 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.KeyLookup.rows_path': ( 'api/pds.utils.html#keylookup.rows_path',
+                                                                                      'planetarypy/pds/utils.py'),
                                        'planetarypy.pds.utils.PVLColumn': ('api/pds.utils.html#pvlcolumn', 'planetarypy/pds/utils.py'),
                                        'planetarypy.pds.utils.PVLColumn.__init__': ( 'api/pds.utils.html#pvlcolumn.__init__',
                                                                                      'planetarypy/pds/utils.py'),
@@ -634,8 +733,14 @@ d = { 'settings': { 'branch': 'master',
                                                                                      'planetarypy/pds/utils.py'),
                                        'planetarypy.pds.utils.PVLColumn.colspecs': ( 'api/pds.utils.html#pvlcolumn.colspecs',
                                                                                      'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.PVLColumn.data_type': ( 'api/pds.utils.html#pvlcolumn.data_type',
+                                                                                      'planetarypy/pds/utils.py'),
                                        'planetarypy.pds.utils.PVLColumn.decode': ( 'api/pds.utils.html#pvlcolumn.decode',
                                                                                    'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.PVLColumn.description': ( 'api/pds.utils.html#pvlcolumn.description',
+                                                                                        'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.PVLColumn.is_time': ( 'api/pds.utils.html#pvlcolumn.is_time',
+                                                                                    'planetarypy/pds/utils.py'),
                                        'planetarypy.pds.utils.PVLColumn.item_bytes': ( 'api/pds.utils.html#pvlcolumn.item_bytes',
                                                                                        'planetarypy/pds/utils.py'),
                                        'planetarypy.pds.utils.PVLColumn.item_offset': ( 'api/pds.utils.html#pvlcolumn.item_offset',
@@ -646,10 +751,70 @@ d = { 'settings': { 'branch': 'master',
                                                                                  'planetarypy/pds/utils.py'),
                                        'planetarypy.pds.utils.PVLColumn.name_as_list': ( 'api/pds.utils.html#pvlcolumn.name_as_list',
                                                                                          'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.PVLColumn.slices': ( 'api/pds.utils.html#pvlcolumn.slices',
+                                                                                   'planetarypy/pds/utils.py'),
                                        'planetarypy.pds.utils.PVLColumn.start': ( 'api/pds.utils.html#pvlcolumn.start',
                                                                                   'planetarypy/pds/utils.py'),
                                        'planetarypy.pds.utils.PVLColumn.stop': ( 'api/pds.utils.html#pvlcolumn.stop',
                                                                                  'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.RecordDecoder': ( 'api/pds.utils.html#recorddecoder',
+                                                                                'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.RecordDecoder.__init__': ( 'api/pds.utils.html#recorddecoder.__init__',
+                                                                                         'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.RecordDecoder.__repr__': ( 'api/pds.utils.html#recorddecoder.__repr__',
+                                                                                         'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.RecordDecoder._typed_format': ( 'api/pds.utils.html#recorddecoder._typed_format',
+                                                                                              'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.RecordDecoder.decode_block': ( 'api/pds.utils.html#recorddecoder.decode_block',
+                                                                                             'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.RecordDecoder.decode_line': ( 'api/pds.utils.html#recorddecoder.decode_line',
+                                                                                            'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.RecordDecoder.fields': ( 'api/pds.utils.html#recorddecoder.fields',
+                                                                                       'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.RecordDecoder.records': ( 'api/pds.utils.html#recorddecoder.records',
+                                                                                        'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.TabFile': ('api/pds.utils.html#tabfile', 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.TabFile.__getitem__': ( 'api/pds.utils.html#tabfile.__getitem__',
+                                                                                      'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.TabFile.__init__': ( 'api/pds.utils.html#tabfile.__init__',
+                                                                                   'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.TabFile.__len__': ( 'api/pds.utils.html#tabfile.__len__',
+                                                                                  'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.TabFile.__repr__': ( 'api/pds.utils.html#tabfile.__repr__',
+                                                                                   'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.TabFile._record_numbers': ( 'api/pds.utils.html#tabfile._record_numbers',
+                                                                                          'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.TabFile.raw': ('api/pds.utils.html#tabfile.raw', 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.TabFile.sample': ( 'api/pds.utils.html#tabfile.sample',
+                                                                                 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils._coerce_mixed_column': ( 'api/pds.utils.html#_coerce_mixed_column',
+                                                                                       'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils._decode_column': ( 'api/pds.utils.html#_decode_column',
+                                                                                 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils._fix_block': ('api/pds.utils.html#_fix_block', 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils._iter_record_ranges': ( 'api/pds.utils.html#_iter_record_ranges',
+                                                                                      'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils._map_records': ( 'api/pds.utils.html#_map_records',
+                                                                               'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils._merge_sorted_runs': ( 'api/pds.utils.html#_merge_sorted_runs',
+                                                                                     'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils._narrowest_int': ( 'api/pds.utils.html#_narrowest_int',
+                                                                                 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils._number_parser': ( 'api/pds.utils.html#_number_parser',
+                                                                                 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils._read_record_range': ( 'api/pds.utils.html#_read_record_range',
+                                                                                     'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils._records_to_df': ( 'api/pds.utils.html#_records_to_df',
+                                                                                 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils._row_key': ('api/pds.utils.html#_row_key', 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils._sort_indices': ( 'api/pds.utils.html#_sort_indices',
+                                                                                'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils._strip_field': ( 'api/pds.utils.html#_strip_field',
+                                                                               'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils._write_row_groups': ( 'api/pds.utils.html#_write_row_groups',
+                                                                                    'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.apply_label_dtypes': ( 'api/pds.utils.html#apply_label_dtypes',
+                                                                                     'planetarypy/pds/utils.py'),
                                        'planetarypy.pds.utils.convert_times': ( 'api/pds.utils.html#convert_times',
                                                                                 'planetarypy/pds/utils.py'),
                                        'planetarypy.pds.utils.decode_line': ('api/pds.utils.html#decode_line', 'planetarypy/pds/utils.py'),
@@ -657,15 +822,25 @@ d = { 'settings': { 'branch': 'master',
                                                                                        'planetarypy/pds/utils.py'),
                                        'planetarypy.pds.utils.fix_hirise_edrcumindex': ( 'api/pds.utils.html#fix_hirise_edrcumindex',
                                                                                          'planetarypy/pds/utils.py'),
-                                       'planetarypy.pds.utils.index_to_df': ('api/pds.utils.html#index_to_df', 'planetarypy/pds/utils.py')},
+                                       'planetarypy.pds.utils.fix_records': ('api/pds.utils.html#fix_records', 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.index_to_df': ('api/pds.utils.html#index_to_df', 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.index_to_parquet': ( 'api/pds.utils.html#index_to_parquet',
+                                                                                   'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.iter_index_batches': ( 'api/pds.utils.html#iter_index_batches',
+                                                                                     'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.iter_record_blocks': ( 'api/pds.utils.html#iter_record_blocks',
+                                                                                     'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.load_label': ('api/pds.utils.html#load_label', 'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.optimize_parquet_layout': ( 'api/pds.utils.html#optimize_parquet_layout',
+                                                                                          'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.read_fixed_width': ( 'api/pds.utils.html#read_fixed_width',
+                                                                                   'planetarypy/pds/utils.py'),
+                                       'planetarypy.pds.utils.truncate_overlong_reals': ( 'api/pds.utils.html#truncate_overlong_reals',
+                                                                                          'planetarypy/pds/utils.py')},
             'planetarypy.spice.kernels': { 'planetarypy.spice.kernels.Subsetter': ( 'api/spice.kernels.html#subsetter',
                                                                                     'planetarypy/spice/kernels.py'),
                                            'planetarypy.spice.kernels.Subsetter.__init__': ( 'api/spice.kernels.html#subsetter.__init__',
                                                                                              'planetarypy/spice/kernels.py'),
-                                           'planetarypy.spice.kernels.Subsetter._concurrent_download': ( 'api/spice.kernels.html#subsetter._concurrent_download',
-                                                                                                         'planetarypy/spice/kernels.py'),
-                                           'planetarypy.spice.kernels.Subsetter._non_blocking_download': ( 'api/spice.kernels.html#subsetter._non_blocking_download',
-                                                                                                           'planetarypy/spice/kernels.py'),
                                            'planetarypy.spice.kernels.Subsetter.download_kernels': ( 'api/spice.kernels.html#subsetter.download_kernels',
                                                                                                      'planetarypy/spice/kernels.py'),
                                            'planetarypy.spice.kernels.Subsetter.get_local_path': ( 'api/spice.kernels.html#subsetter.get_local_path',
@@ -840,30 +1015,104 @@ d = { 'settings': { 'branch': 'master',
                                                                                               'planetarypy/spice/spicer.py'),
                                           'planetarypy.spice.spicer.make_axis_rotation_matrix': ( 'api/spice.spicer.html#make_axis_rotation_matrix',
                                                                                                   'planetarypy/spice/spicer.py')},
-            'planetarypy.utils': { 'planetarypy.utils._nasa_date_to_datetime': ( 'api/utils.html#_nasa_date_to_datetime',
+            'planetarypy.utils': { 'planetarypy.utils.DownloadManifest': ('api/utils.html#downloadmanifest', 'planetarypy/utils.py'),
+                                   'planetarypy.utils.DownloadManifest.__init__': ( 'api/utils.html#downloadmanifest.__init__',
+                                                                                    'planetarypy/utils.py'),
+                                   'planetarypy.utils.DownloadManifest.__len__': ( 'api/utils.html#downloadmanifest.__len__',
+                                                                                   'planetarypy/utils.py'),
+                                   'planetarypy.utils.DownloadManifest.__repr__': ( 'api/utils.html#downloadmanifest.__repr__',
+                                                                                    'planetarypy/utils.py'),
+                                   'planetarypy.utils.DownloadManifest._key': ( 'api/utils.html#downloadmanifest._key',
+                                                                                'planetarypy/utils.py'),
+                                   'planetarypy.utils.DownloadManifest._set_checksum': ( 'api/utils.html#downloadmanifest._set_checksum',
+                                                                                         'planetarypy/utils.py'),
+                                   'planetarypy.utils.DownloadManifest.find': ( 'api/utils.html#downloadmanifest.find',
+                                                                                'planetarypy/utils.py'),
+                                   'planetarypy.utils.DownloadManifest.forget': ( 'api/utils.html#downloadmanifest.forget',
+                                                                                  'planetarypy/utils.py'),
+                                   'planetarypy.utils.DownloadManifest.get': ( 'api/utils.html#downloadmanifest.get',
+                                                                               'planetarypy/utils.py'),
+                                   'planetarypy.utils.DownloadManifest.is_intact': ( 'api/utils.html#downloadmanifest.is_intact',
+                                                                                     'planetarypy/utils.py'),
+                                   'planetarypy.utils.DownloadManifest.record': ( 'api/utils.html#downloadmanifest.record',
+                                                                                  'planetarypy/utils.py'),
+                                   'planetarypy.utils.DownloadManifest.verify': ( 'api/utils.html#downloadmanifest.verify',
+                                                                                  'planetarypy/utils.py'),
+                                   'planetarypy.utils.URLExistenceCache': ('api/utils.html#urlexistencecache', 'planetarypy/utils.py'),
+                                   'planetarypy.utils.URLExistenceCache.__init__': ( 'api/utils.html#urlexistencecache.__init__',
+                                                                                     'planetarypy/utils.py'),
+                                   'planetarypy.utils.URLExistenceCache.__len__': ( 'api/utils.html#urlexistencecache.__len__',
+                                                                                    'planetarypy/utils.py'),
+                                   'planetarypy.utils.URLExistenceCache.__repr__': ( 'api/utils.html#urlexistencecache.__repr__',
+                                                                                     'planetarypy/utils.py'),
+                                   'planetarypy.utils.URLExistenceCache.clear': ( 'api/utils.html#urlexistencecache.clear',
+                                                                                  'planetarypy/utils.py'),
+                                   'planetarypy.utils.URLExistenceCache.get': ( 'api/utils.html#urlexistencecache.get',
+                                                                                'planetarypy/utils.py'),
+                                   'planetarypy.utils.URLExistenceCache.set': ( 'api/utils.html#urlexistencecache.set',
+                                                                                'planetarypy/utils.py'),
+                                   'planetarypy.utils._FileHash': ('api/utils.html#_filehash', 'planetarypy/utils.py'),
+                                   'planetarypy.utils._FileHash.__init__': ('api/utils.html#_filehash.__init__', 'planetarypy/utils.py'),
+                                   'planetarypy.utils._FileHash.hexdigest': ('api/utils.html#_filehash.hexdigest', 'planetarypy/utils.py'),
+                                   'planetarypy.utils._FileHash.sync': ('api/utils.html#_filehash.sync', 'planetarypy/utils.py'),
+                                   'planetarypy.utils._FileHash.update': ('api/utils.html#_filehash.update', 'planetarypy/utils.py'),
+                                   'planetarypy.utils._LinkParser': ('api/utils.html#_linkparser', 'planetarypy/utils.py'),
+                                   'planetarypy.utils._LinkParser.__init__': ( 'api/utils.html#_linkparser.__init__',
+                                                                               'planetarypy/utils.py'),
+                                   'planetarypy.utils._LinkParser.handle_starttag': ( 'api/utils.html#_linkparser.handle_starttag',
+                                                                                      'planetarypy/utils.py'),
+                                   'planetarypy.utils._RetryableError': ('api/utils.html#_retryableerror', 'planetarypy/utils.py'),
+                                   'planetarypy.utils._Session': ('api/utils.html#_session', 'planetarypy/utils.py'),
+                                   'planetarypy.utils._Session.request': ('api/utils.html#_session.request', 'planetarypy/utils.py'),
+                                   'planetarypy.utils._char_matrix': ('api/utils.html#_char_matrix', 'planetarypy/utils.py'),
+                                   'planetarypy.utils._check_status': ('api/utils.html#_check_status', 'planetarypy/utils.py'),
+                                   'planetarypy.utils._digits_field': ('api/utils.html#_digits_field', 'planetarypy/utils.py'),
+                                   'planetarypy.utils._download_range': ('api/utils.html#_download_range', 'planetarypy/utils.py'),
+                                   'planetarypy.utils._download_segments': ('api/utils.html#_download_segments', 'planetarypy/utils.py'),
+                                   'planetarypy.utils._download_urls': ('api/utils.html#_download_urls', 'planetarypy/utils.py'),
+                                   'planetarypy.utils._get_download_session': ( 'api/utils.html#_get_download_session',
+                                                                                'planetarypy/utils.py'),
+                                   'planetarypy.utils._head_exists': ('api/utils.html#_head_exists', 'planetarypy/utils.py'),
+                                   'planetarypy.utils._make_session': ('api/utils.html#_make_session', 'planetarypy/utils.py'),
+                                   'planetarypy.utils._nasa_date_to_datetime': ( 'api/utils.html#_nasa_date_to_datetime',
                                                                                  'planetarypy/utils.py'),
                                    'planetarypy.utils._nasa_datetime_to_datetime': ( 'api/utils.html#_nasa_datetime_to_datetime',
                                                                                      'planetarypy/utils.py'),
                                    'planetarypy.utils._nasa_datetimems_to_datetime': ( 'api/utils.html#_nasa_datetimems_to_datetime',
                                                                                        'planetarypy/utils.py'),
+                                   'planetarypy.utils._remote_size': ('api/utils.html#_remote_size', 'planetarypy/utils.py'),
+                                   'planetarypy.utils._time_of_day': ('api/utils.html#_time_of_day', 'planetarypy/utils.py'),
+                                   'planetarypy.utils._with_retries': ('api/utils.html#_with_retries', 'planetarypy/utils.py'),
                                    'planetarypy.utils.catch_isis_error': ('api/utils.html#catch_isis_error', 'planetarypy/utils.py'),
                                    'planetarypy.utils.check_url_exists': ('api/utils.html#check_url_exists', 'planetarypy/utils.py'),
+                                   'planetarypy.utils.check_urls_exist': ('api/utils.html#check_urls_exist', 'planetarypy/utils.py'),
+                                   'planetarypy.utils.configure_session': ('api/utils.html#configure_session', 'planetarypy/utils.py'),
+                                   'planetarypy.utils.download_manifest': ('api/utils.html#download_manifest', 'planetarypy/utils.py'),
+                                   'planetarypy.utils.download_urls': ('api/utils.html#download_urls', 'planetarypy/utils.py'),
+                                   'planetarypy.utils.file_sha256': ('api/utils.html#file_sha256', 'planetarypy/utils.py'),
                                    'planetarypy.utils.file_variations': ('api/utils.html#file_variations', 'planetarypy/utils.py'),
                                    'planetarypy.utils.get_gdal_center_coords': ( 'api/utils.html#get_gdal_center_coords',
                                                                                  'planetarypy/utils.py'),
                                    'planetarypy.utils.get_remote_timestamp': ( 'api/utils.html#get_remote_timestamp',
                                                                                'planetarypy/utils.py'),
+                                   'planetarypy.utils.get_session': ('api/utils.html#get_session', 'planetarypy/utils.py'),
+                                   'planetarypy.utils.get_url_tail': ('api/utils.html#get_url_tail', 'planetarypy/utils.py'),
                                    'planetarypy.utils.have_internet': ('api/utils.html#have_internet', 'planetarypy/utils.py'),
                                    'planetarypy.utils.height_from_shadow': ('api/utils.html#height_from_shadow', 'planetarypy/utils.py'),
+                                   'planetarypy.utils.is_downloaded': ('api/utils.html#is_downloaded', 'planetarypy/utils.py'),
                                    'planetarypy.utils.iso_to_nasa_datetime': ( 'api/utils.html#iso_to_nasa_datetime',
                                                                                'planetarypy/utils.py'),
                                    'planetarypy.utils.iso_to_nasa_time': ('api/utils.html#iso_to_nasa_time', 'planetarypy/utils.py'),
+                                   'planetarypy.utils.list_links': ('api/utils.html#list_links', 'planetarypy/utils.py'),
                                    'planetarypy.utils.nasa_time_to_datetime': ( 'api/utils.html#nasa_time_to_datetime',
                                                                                 'planetarypy/utils.py'),
                                    'planetarypy.utils.nasa_time_to_iso': ('api/utils.html#nasa_time_to_iso', 'planetarypy/utils.py'),
+                                   'planetarypy.utils.nasa_times_to_datetime': ( 'api/utils.html#nasa_times_to_datetime',
+                                                                                 'planetarypy/utils.py'),
                                    'planetarypy.utils.parse_http_date': ('api/utils.html#parse_http_date', 'planetarypy/utils.py'),
                                    'planetarypy.utils.replace_all_nasa_times': ( 'api/utils.html#replace_all_nasa_times',
                                                                                  'planetarypy/utils.py'),
+                                   'planetarypy.utils.url_cache': ('api/utils.html#url_cache', 'planetarypy/utils.py'),
                                    'planetarypy.utils.url_retrieve': ('api/utils.html#url_retrieve', 'planetarypy/utils.py')},
             'planetarypy.uvis': { 'planetarypy.uvis.DataManager': ('api/cassini_uvis.html#datamanager', 'planetarypy/uvis.py'),
                                   'planetarypy.uvis.DataManager.__init__': ( 'api/cassini_uvis.html#datamanager.__init__',
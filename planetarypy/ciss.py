@@ -13,7 +13,7 @@ from yarl import URL
 from .config import config
 from .pds.apps import get_index
 from .pds.opusapi import OPUS
-from .utils import have_internet, url_retrieve
+from .utils import have_internet, is_downloaded, url_retrieve
 
 # %% ../notebooks/api/06_cassini_iss.ipynb 3
 base_url = URL("https://opus.pds-rings.seti.org/holdings")
@@ -150,18 +150,26 @@ class ISS:
 
     def download_raw(self, overwrite=False):
         self.local_data_path.parent.mkdir(parents=True, exist_ok=True)
-        if self.local_data_path.exists() and not overwrite:
-            print("File exists. Use `overwrite=True` to download fresh.")
+        files = [
+            (self.raw_data_url, self.local_data_path),
+            (self.raw_label_url, self.local_label_path),
+        ]
+        missing = [
+            (url, path)
+            for url, path in files
+            if overwrite or not is_downloaded(path, url)
+        ]
+        if not missing:
+            print("Files exist. Use `overwrite=True` to download fresh.")
             return
-        url_retrieve(self.raw_data_url, self.local_data_path)
-        url_retrieve(self.raw_label_url, self.local_label_path)
+        for url, path in missing:
+            url_retrieve(url, path)
 
     def download_calib(self, overwrite=False):
         self.local_calib_path.parent.mkdir(parents=True, exist_ok=True)
-        if self.local_calib_path.exists():
-            if not overwrite:
-                print("File exists. Use `overwrite` to force re-download.")
-                return
+        if not overwrite and is_downloaded(self.local_calib_path, self.calib_data_url):
+            print("File exists. Use `overwrite` to force re-download.")
+            return
         url_retrieve(self.calib_data_url, self.local_calib_path)
 
     def __repr__(self):
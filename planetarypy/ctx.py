@@ -3,14 +3,17 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../notebooks/api/03_ctx.ipynb.
 
 # %% auto 0
-__all__ = ['baseurl', 'storage_root', 'cache', 'get_edr_index', 'CTXEDR', 'CTX', 'CTXCollection', 'ctx_calib']
+__all__ = ['baseurl', 'storage_root', 'cache', 'get_edr_index', 'get_edr_meta', 'CTXEDR', 'CTX', 'CTXCollection', 'ctx_calib']
 
 # %% ../notebooks/api/03_ctx.ipynb 3
 import warnings
+from functools import cached_property
 from itertools import repeat
 from pathlib import Path
 
 import hvplot.xarray  # noqa
+import numpy as np
+import pandas as pd
 import rasterio
 import rioxarray as rxr
 from fastcore.script import call_parse
@@ -19,8 +22,8 @@ from tqdm.contrib.concurrent import process_map
 from yarl import URL
 
 from .config import config
-from .pds.apps import get_index
-from .utils import catch_isis_error, file_variations, url_retrieve
+from .pds.apps import get_index, prepare_index
+from .utils import catch_isis_error, download_urls, file_variations, is_downloaded, url_retrieve
 
 try:
     from kalasiris.pysis import (
@@ -53,7 +56,28 @@ def get_edr_index(refresh=False):
         cache["edrindex"] = edrindex
         return edrindex
 
-# %% ../notebooks/api/03_ctx.ipynb 9
+# %% ../notebooks/api/03_ctx.ipynb 8
+def get_edr_meta(
+    pid: str,  # CTX product id, or its short form (first 15 characters)
+    refresh=False,  # switch to refresh the index before the lookup
+) -> pd.Series:  # The EDR index record of `pid`
+    """Get the EDR index record of one product without loading the full index.
+
+    Uses the persistent PRODUCT_ID lookup table of the index, see `KeyLookup`.
+    """
+    if "edr_lookup" not in cache or refresh:
+        index = prepare_index("mro.ctx", "edr", refresh=refresh)
+        cache["edr_lookup"] = index.key_lookup("PRODUCT_ID")
+    lookup = cache["edr_lookup"]
+    if len(pid) < 26:
+        row = lookup.find_prefix(pid[:15])  # use short_pid
+    else:
+        row = lookup.find(pid)[0]
+    if row < 0:
+        raise KeyError(f"{pid} not found in the CTX EDR index.")
+    return lookup.read(row).iloc[0]
+
+# %% ../notebooks/api/03_ctx.ipynb 10
 class CTXEDR:
     """Manage access to EDR data"""
 
@@ -68,15 +92,17 @@ class CTXEDR:
         with_volume=None,  # does the storage path include the volume folder
         with_pid_folder=None,  # control if stuff is stored inside PID folders
         refresh_index=False,
+        meta: dict = None,  # index record of `pid`, if already known, to skip the index lookup
     ):
         self.pid = pid
+        if meta is not None:
+            self._meta = pd.Series(meta).rename(str.lower)
         self.root = Path(root) if root else Path(self.root)
         self.with_volume = with_volume if with_volume is not None else self.with_volume
         self.with_pid_folder = (
             with_pid_folder if with_pid_folder is not None else self.with_pid_folder
         )
         self.refresh_index = refresh_index
-        self.edrindex = None
 
     @property
     def pid(self):
@@ -85,11 +111,13 @@ class CTXEDR:
 
     @pid.setter
     def pid(self, value):
+        meta = None
         if len(value) < 26:
-            val = value[:15]  # use short_pid
-            self.edrindex = get_edr_index()
-            value = self.edrindex.query(f"short_pid=='{val}'").PRODUCT_ID.iloc[0]
+            meta = get_edr_meta(value)  # resolve the short_pid
+            value = meta.PRODUCT_ID
         self._pid = value
+        # cache of the index record, reset for every new product id
+        self._meta = None if meta is None else meta.rename(str.lower)
 
     @property
     def short_pid(self):
@@ -97,11 +125,11 @@ class CTXEDR:
 
     @property
     def meta(self):
-        "get the metadata from the index table"
-        edrindex = get_edr_index(refresh=self.refresh_index)
-        s = edrindex.query("PRODUCT_ID == @self.pid").squeeze()
-        s.index = s.index.str.lower()
-        return s
+        "get the metadata from the index table, looked up only once per product id"
+        if self._meta is None:
+            meta = get_edr_meta(self.pid, refresh=self.refresh_index)
+            self._meta = meta.rename(str.lower)
+        return self._meta
 
     @property
     def volume(self):
@@ -131,7 +159,7 @@ class CTXEDR:
 
     def download(self, overwrite=False):  # use `overwrite` to download in all cases.
         "Download and store correctly the EDR data, if not locally available."
-        if self.source_path.exists() and not overwrite:
+        if not overwrite and is_downloaded(self.source_path, self.url):
             print("File exists. Use `overwrite=True` to download fresh.")
             return
         self.source_folder.mkdir(parents=True, exist_ok=True)
@@ -147,7 +175,7 @@ class CTXEDR:
     def __repr__(self):
         return self.__str__()
 
-# %% ../notebooks/api/03_ctx.ipynb 33
+# %% ../notebooks/api/03_ctx.ipynb 34
 class CTX:
     """Class to manage dealing with CTX data.
 
@@ -171,8 +199,9 @@ class CTX:
         with_volume=None,  # store with extra volume subfolder?
         with_pid_folder=None,  # store with extra product_id subfolder?
         use_preproc=False,  # use preproc for cal_da
+        meta: dict = None,  # index record of the product, if already known
     ):
-        self.edr = CTXEDR(id_, root=source_dir, with_volume=with_volume)
+        self.edr = CTXEDR(id_, root=source_dir, with_volume=with_volume, meta=meta)
         self.proc_root = Path(proc_root) if proc_root else self.proc_root
         self.with_volume = with_volume if with_volume else self.proc_with_volume
         self.with_pid_folder = (
@@ -390,7 +419,7 @@ class CTX:
     def __repr__(self):
         return self.__str__()
 
-# %% ../notebooks/api/03_ctx.ipynb 64
+# %% ../notebooks/api/03_ctx.ipynb 65
 class CTXCollection:
     """Class with several helpful methods to work with a set of CTX images.
 
@@ -423,8 +452,7 @@ class CTXCollection:
     @classmethod
     def volume_from_pid(cls, pid, **kwargs):
         """Get a CTXCollection of the volume for a given image (product_id)."""
-        edrindex = get_edr_index()
-        vol = edrindex.query(f"PRODUCT_ID=='{pid}'").VOLUME_ID.iat[0]
+        vol = get_edr_meta(pid).VOLUME_ID
         return cls.by_volume(vol, **kwargs)
 
     def __init__(
@@ -460,6 +488,43 @@ class CTXCollection:
     def product_ids(self, val):
         self._product_ids = val
 
+    @cached_property
+    def _index_volumes(self) -> pd.Series:
+        "VOLUME_ID of the EDR index by PRODUCT_ID, built once per collection."
+        volumes = self.edrindex[["PRODUCT_ID", "VOLUME_ID"]].astype("string")
+        return volumes.drop_duplicates("PRODUCT_ID").set_index("PRODUCT_ID").VOLUME_ID
+
+    def _volume_table(self) -> pd.DataFrame:
+        "PRODUCT_ID and VOLUME_ID of all product_ids, in their order, via one lookup in the index."
+        pids = pd.Series(self.product_ids, dtype="string")
+        volumes = self._index_volumes.reindex(pids).array
+        return pd.DataFrame({"PRODUCT_ID": pids, "VOLUME_ID": volumes})
+
+    @property
+    def volumes(self) -> np.ndarray:
+        "Lower-case PDS volume of each product_id, as used in URLs and storage paths."
+        return self._volume_table().VOLUME_ID.str.lower().to_numpy(dtype=object)
+
+    @property
+    def urls(self) -> np.ndarray:
+        "PDS download URL of each product_id, as strings."
+        df = self._volume_table()
+        urls = f"{baseurl}/" + df.VOLUME_ID.str.lower() + "/data/" + df.PRODUCT_ID + ".IMG"
+        return urls.to_numpy(dtype=object)
+
+    @property
+    def source_paths(self) -> np.ndarray:
+        "Local EDR path of each product_id, following the storage options of `CTXEDR`."
+        df = self._volume_table()
+        root = Path(CTXEDR.root)
+        folders = [root] * len(df)
+        if CTXEDR.with_volume:
+            folders = [f / vol for f, vol in zip(folders, df.VOLUME_ID.str.lower())]
+        if CTXEDR.with_pid_folder:
+            folders = [f / pid for f, pid in zip(folders, df.PRODUCT_ID)]
+        paths = [f / f"{pid}.IMG" for f, pid in zip(folders, df.PRODUCT_ID)]
+        return np.array(paths, dtype=object)
+
     def get_urls(self):
         """Get URLs for list of product_ids.
 
@@ -468,33 +533,48 @@ class CTXCollection:
         List[yarl.URL]
             List of URL objects with the respective PDS URL for download.
         """
-        urls = []
-        for p_id in self.product_ids:
-            ctx = CTXEDR(p_id)
-            urls.append(ctx.url)
-        self.urls = urls
-        return urls
-
-    def _do_download(self, args):
-        pid, overwrite = args
-        ctx = CTX(pid)
-        ctx.download(overwrite=overwrite)
-
-    def download_collection(self, overwrite=False):
-        "download the images in parallel using tqdm wrapper around concurrent.future"
+        return [URL(url) for url in self.urls]
+
+    def _worker_args(self, overwrite):
+        """Arguments for the parallel workers, one tuple per product_id.
+
+        Each tuple carries the index record of its product, so the worker processes
+        neither need to load nor to look up the EDR index themselves.
+        Warns about the product_ids that are skipped because they are not in the EDR index.
+        """
+        requested = pd.Series(self._product_ids, dtype="string").drop_duplicates()
+        missing = requested[~requested.isin(self.edrindex.PRODUCT_ID)].tolist()
+        if missing:
+            warnings.warn(
+                f"Skipping {len(missing)} product_ids that are not in the CTX EDR index: "
+                + ", ".join(missing[:5])
+                + (", ..." if len(missing) > 5 else "")
+            )
+        meta = self.meta.drop_duplicates("PRODUCT_ID")
+        return list(zip(meta.PRODUCT_ID, meta.to_dict("records"), repeat(overwrite)))
+
+    def download_collection(
+        self,
+        overwrite=False,  # use `overwrite` to download in all cases.
+        **kwargs,  # passed on to `utils.download_urls`, e.g. `max_concurrent`
+    ):
+        "Download the EDRs of all product_ids concurrently, see `utils.download_urls`."
         print("Downloading collection...")
-        args = zip(self.product_ids, repeat(overwrite))
-        r = process_map(self._do_download, args, max_workers=6)
+        return download_urls(
+            zip(self.urls, self.source_paths), overwrite=overwrite, **kwargs
+        )
 
-    def _do_calib(self, args):
-        pid, overwrite = args
-        ctx = CTX(pid)
+    # static, so that the collection with its index isn't pickled for every worker call
+    @staticmethod
+    def _do_calib(args):
+        pid, meta, overwrite = args
+        ctx = CTX(pid, meta=meta)
         ctx.calib_pipeline(overwrite=overwrite)
 
     def calibrate_collection(self, overwrite=False):
         "Calibrate all images in collection using tqdm wrapper around concurrent.future"
         print("Launching parallel calibration...")
-        args = zip(self.product_ids, repeat(overwrite))
+        args = self._worker_args(overwrite)
         process_map(self._do_calib, args, max_workers=6)
 
     def edr_exist_check(self):
@@ -565,7 +645,7 @@ class CTXCollection:
     def __repr__(self):
         return self.__str__()
 
-# %% ../notebooks/api/03_ctx.ipynb 107
+# %% ../notebooks/api/03_ctx.ipynb 108
 @call_parse
 def ctx_calib(
     pid: str,  # CTX product_id
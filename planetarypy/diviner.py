@@ -14,7 +14,7 @@ from yarl import URL
 import hvplot.xarray  # noqa
 import pandas as pd
 from .config import config
-from .utils import url_retrieve
+from .utils import is_downloaded, url_retrieve
 
 # %% ../notebooks/api/07_diviner.ipynb 4
 hostname = socket.gethostname()
@@ -64,7 +64,7 @@ class DataManager:
         return storage_root / Path(*end)
 
     def download(self, overwrite=False):
-        if self.local_path.exists() and not overwrite:
+        if not overwrite and is_downloaded(self.local_path, self.url):
             print("File exists. Use `overwrite=True` to get a fresh copy.")
             return
         self.local_path.parent.mkdir(parents=True, exist_ok=True)
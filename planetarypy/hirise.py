@@ -3,17 +3,17 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../notebooks/api/04_hirise.ipynb.
 
 # %% auto 0
-__all__ = ['logger', 'storage_root', 'baseurl', 'rdrindex', 'OBSID', 'ProductPathfinder', 'COLOR_PRODUCT', 'RGB_NOMAP',
-           'RGB_NOMAPCollection', 'SOURCE_PRODUCT', 'RED_PRODUCT', 'IR_PRODUCT', 'BG_PRODUCT', 'RedMosaic']
+__all__ = ['logger', 'storage_root', 'baseurl', 'rdrindex', 'cache', 'urls_exist', 'OBSID', 'ProductPathfinder', 'COLOR_PRODUCT',
+           'RGB_NOMAP', 'RGB_NOMAPCollection', 'SOURCE_PRODUCT', 'RED_PRODUCT', 'IR_PRODUCT', 'BG_PRODUCT', 'RedMosaic']
 
 # %% ../notebooks/api/04_hirise.ipynb 3
 import logging
 import warnings
 import webbrowser
 
+import pandas as pd
 import rasterio
 import rioxarray as rxr
-from dask import compute, delayed
 from yarl import URL
 
 import hvplot
@@ -22,7 +22,8 @@ import hvplot.xarray  # noqa
 from fastcore.utils import Path
 from .config import config
 from .pds.apps import get_index
-from .utils import check_url_exists, url_retrieve
+from .pds.indexes import Index
+from .utils import check_urls_exist, download_urls, is_downloaded, url_retrieve
 
 warnings.filterwarnings("ignore", category=rasterio.errors.NotGeoreferencedWarning)
 
@@ -35,6 +36,65 @@ baseurl = URL("https://hirise-pds.lpl.arizona.edu/PDS")
 rdrindex = get_index("mro.hirise", "rdr")
 
 # %% ../notebooks/api/04_hirise.ipynb 6
+cache = dict()
+
+
+def _index_lookup(
+    index_name: str,  # "rdr" or "edr"
+):
+    "PRODUCT_ID lookup table of the local HiRISE index, see `KeyLookup`."
+    key = f"{index_name}_lookup"
+    if key not in cache:
+        index = Index(f"mro.hirise.indexes.{index_name}", check_update=False)
+        if not index.local_table_path.exists():
+            raise FileNotFoundError(
+                f"The HiRISE {index_name.upper()} index is not available locally. Download it "
+                f"with `prepare_index(\"mro.hirise\", \"{index_name}\")`, or check the URLs online."
+            )
+        cache[key] = index.key_lookup("PRODUCT_ID")
+    return cache[key]
+
+
+def _index_product_id(
+    url: str,  # URL of a HiRISE PDS file
+) -> (str, str):  # Name of the index that lists the file's product, and its PRODUCT_ID
+    url = URL(str(url))
+    pid = url.name.split(".")[0]
+    if "EDR" in url.parts[:3]:
+        return "edr", pid
+    # the EXTRAS are derived from the RDR product of the same color
+    obsid, kind = pid.rsplit("_", 1)
+    return "rdr", f"{obsid}_{'RED' if kind == 'RED' else 'COLOR'}"
+
+
+def urls_exist(
+    urls,  # URLs of HiRISE PDS files, e.g. from `ProductPathfinder(pid, check_url=False)`
+    offline: bool = False,  # Switch to decide with the local RDR/EDR indexes instead of the server
+    **kwargs,  # Passed on to `utils.check_urls_exist`, e.g. `ttl`, or `cache=False`
+) -> dict:  # URL string -> True if it exists
+    """Check the existence of many HiRISE files at once.
+
+    Online, the URLs are checked concurrently and the ones found are cached persistently,
+    see `utils.check_urls_exist`.
+    With `offline`, a file counts as existing if its product is listed in the local RDR or
+    EDR index, found with the persistent PRODUCT_ID lookup tables, without any network access.
+    The indexes are not downloaded for that, a missing one raises a FileNotFoundError.
+    Files of the RDR EXTRAS folder are assumed to exist for all released RDR products.
+    """
+    urls = [str(url) for url in urls]
+    if not offline:
+        kwargs.setdefault("cache", True)
+        return check_urls_exist(urls, **kwargs)
+    products = pd.DataFrame(
+        [_index_product_id(url) for url in urls], columns=["index", "pid"], index=urls
+    )
+    results = {}
+    for index_name, group in products.groupby("index"):
+        rows = _index_lookup(index_name).find(group.pid.tolist())
+        results.update(zip(group.index, (rows >= 0).tolist()))
+    return {url: results[url] for url in urls}
+
+# %% ../notebooks/api/04_hirise.ipynb 7
 class OBSID:
     """Manage HiRISE observation ids.
 
@@ -105,7 +165,7 @@ class OBSID:
     def storage_path_stem(self):
         return f"{self.phase}/{self.upper_orbit_folder}/{self.id}"
 
-# %% ../notebooks/api/04_hirise.ipynb 13
+# %% ../notebooks/api/04_hirise.ipynb 14
 class ProductPathfinder:
     """Determine paths and URLs for HiRISE RDR products (also EXTRAS.)
 
@@ -128,7 +188,9 @@ class ProductPathfinder:
             self,
             initstr: str,  # PRODUCT_ID string, e.g. PSP_003092_0985_RED
             check_url: bool = True,  # for performance, the user might not want the url check
+            offline: bool = False,  # check URLs with the local indexes instead of the server, see `urls_exist`
     ):
+        self._urls = {}  # cache of the (checked) URLs, reset when the product changes
         tokens = initstr.split("_")
         self._obsid = OBSID("_".join(tokens[:3]))
         try:
@@ -136,6 +198,7 @@ class ProductPathfinder:
         except IndexError:
             self._kind = None
         self.check_url = check_url
+        self.offline = offline
 
     @property
     def obsid(self):
@@ -144,6 +207,7 @@ class ProductPathfinder:
     @obsid.setter
     def obsid(self, value: str):  # e.g. "PSP_003092_0985"
         self._obsid = OBSID(value)
+        self._urls = {}
 
     @property
     def kind(self):
@@ -157,6 +221,7 @@ class ProductPathfinder:
         if value not in self.kinds:
             raise ValueError(f"kind must be in {self.kinds}")
         self._kind = value
+        self._urls = {}
 
     @property
     def product_id(self):
@@ -194,11 +259,13 @@ class ProductPathfinder:
             
 
     def _make_url(self, obj):
+        if obj in self._urls:
+            return self._urls[obj]
         path = getattr(self, f"{obj}_path")
         url = baseurl / str(path)
-        if self.check_url:
-            if not check_url_exists(url):
-                warnings.warn(f"{url} does not exist on the server.")
+        if self.check_url and not urls_exist([url], offline=self.offline)[str(url)]:
+            warnings.warn(f"{url} does not exist on the server.")
+        self._urls[obj] = url
         return url
 
     def __getattr__(self, item):
@@ -288,7 +355,7 @@ class ProductPathfinder:
     def go_to_homepage(self):
         webbrowser.open(self.homepage)
 
-# %% ../notebooks/api/04_hirise.ipynb 34
+# %% ../notebooks/api/04_hirise.ipynb 35
 class COLOR_PRODUCT:
 
     def __init__(self, obsid):
@@ -324,7 +391,7 @@ class COLOR_PRODUCT:
 
     def download(self, overwrite=False):
         self.local_path.parent.mkdir(parents=True, exist_ok=True)
-        if self.local_path.exists() and not overwrite:
+        if not overwrite and is_downloaded(self.local_path, self.url):
             print("File exists. Use `overwrite=True` to download fresh.")
             return
         url_retrieve(self.url, self.local_path)
@@ -354,7 +421,7 @@ class COLOR_PRODUCT:
             flip_yaxis=True,
         )
 
-# %% ../notebooks/api/04_hirise.ipynb 35
+# %% ../notebooks/api/04_hirise.ipynb 36
 class RGB_NOMAP(COLOR_PRODUCT):
 
     def __init__(self, obsid):
@@ -362,13 +429,23 @@ class RGB_NOMAP(COLOR_PRODUCT):
         self.name = "nomap_jp2"
         self.pathfinder = ProductPathfinder(obsid + "_RGB")
 
-# %% ../notebooks/api/04_hirise.ipynb 46
+# %% ../notebooks/api/04_hirise.ipynb 47
 class RGB_NOMAPCollection:
     """Class to deal with a set of RGB_NOMAP products."""
 
     def __init__(self, obsids):
         self.obsids = obsids
 
+    def products(self):
+        """The RGB_NOMAP products of all obsids.
+
+        Their URLs are checked in one concurrent batch, so that accessing `url` then only uses
+        the cached results instead of one request per product.
+        """
+        products = [RGB_NOMAP(obsid) for obsid in self.obsids]
+        urls_exist([baseurl / str(rgb.remote_path) for rgb in products])
+        return products
+
     def get_urls(self):
         """Get URLs for list of obsids.
 
@@ -377,10 +454,8 @@ class RGB_NOMAPCollection:
         List[yarl.URL]
             List of URL objects with the respective PDS URL for download.
         """
-        urls = []
-        for obsid in self.obsids:
-            rgb = RGB_NOMAP(obsid)
-            urls.append(rgb.url)
+        products = self.products()
+        urls = [rgb.url for rgb in products]
         self.urls = urls
         return urls
 
@@ -392,16 +467,21 @@ class RGB_NOMAPCollection:
             paths.append(rgb.local_path)
         return paths
 
-    def download_collection(self, **kwargs):
-        lazys = []
-        for obsid in self.obsids:
-            rgb = RGB_NOMAP(obsid)
-            lazys.append(delayed(rgb.download)(**kwargs))
+    def download_collection(
+        self,
+        overwrite=False,  # use `overwrite` to download in all cases.
+        **kwargs,  # passed on to `utils.download_urls`, e.g. `max_per_host`
+    ):
+        "Download all products concurrently, see `utils.download_urls`."
+        products = self.products()
         print("Launching parallel download...")
-        compute(*lazys)
+        results = download_urls(
+            [(rgb.url, rgb.local_path) for rgb in products], overwrite=overwrite, **kwargs
+        )
         print("Done.")
+        return results
 
-# %% ../notebooks/api/04_hirise.ipynb 47
+# %% ../notebooks/api/04_hirise.ipynb 48
 class SOURCE_PRODUCT:
     """Manage SOURCE_PRODUCT id.
 
@@ -415,12 +495,12 @@ class SOURCE_PRODUCT:
     bg_ccds = ["BG12", "BG13"]
     ccds = red_ccds + ir_ccds + bg_ccds
 
-    def __init__(self, spid, saveroot=None, check_url=True):
+    def __init__(self, spid, saveroot=None, check_url=True, offline=False):
         tokens = spid.split("_")
         obsid = "_".join(tokens[:3])
         ccd = tokens[3]
         color, ccdno = self._parse_ccd(ccd)
-        self.pid = ProductPathfinder("_".join([obsid, color]))
+        self.pid = ProductPathfinder("_".join([obsid, color]), check_url=check_url, offline=offline)
         self.ccd = ccd
         self.channel = tokens[4]
         self.saveroot = storage_root if saveroot is None else saveroot
@@ -484,9 +564,8 @@ class SOURCE_PRODUCT:
     @property
     def url(self):
         u = baseurl / str(self.remote_path)
-        if self.check_url:
-            if not check_url_exists(u):
-                warnings.warn(f"{u} does not exist on the server.")
+        if self.check_url and not urls_exist([u], offline=self.offline)[str(u)]:
+            warnings.warn(f"{u} does not exist on the server.")
         return u
 
     @property
@@ -508,12 +587,12 @@ class SOURCE_PRODUCT:
 
     def download(self, overwrite=False):
         self.local_path.parent.mkdir(parents=True, exist_ok=True)
-        if self.local_path.exists() and not overwrite:
+        if not overwrite and is_downloaded(self.local_path, self.url):
             print("File exists. Use `overwrite=True` to download fresh.")
             return
         url_retrieve(self.url, self.local_path)
 
-# %% ../notebooks/api/04_hirise.ipynb 67
+# %% ../notebooks/api/04_hirise.ipynb 68
 class RED_PRODUCT(SOURCE_PRODUCT):
     "This exists to support creating a RED_PRODUCT_ID from parts of a SOURCE_PRODUCT id."
 
@@ -521,7 +600,7 @@ class RED_PRODUCT(SOURCE_PRODUCT):
         self.ccds = self.red_ccds
         super().__init__(f"{obsid}_RED{ccdno}_{channel}", **kwargs)
 
-# %% ../notebooks/api/04_hirise.ipynb 73
+# %% ../notebooks/api/04_hirise.ipynb 74
 class IR_PRODUCT(SOURCE_PRODUCT):
 
     def __init__(self, obsid, ccdno, channel):
@@ -535,7 +614,7 @@ class BG_PRODUCT(SOURCE_PRODUCT):
         self.ccds = self.ir_ccds
         super().__init__(f"{obsid}_BG{ccdno}_{channel}", **kwargs)
 
-# %% ../notebooks/api/04_hirise.ipynb 74
+# %% ../notebooks/api/04_hirise.ipynb 75
 class RedMosaic:
     def __init__(self, obsid):
         self.obsid = obsid
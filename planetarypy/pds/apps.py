@@ -3,12 +3,23 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../notebooks/api/02c_pds.apps.ipynb.
 
 # %% auto 0
-__all__ = ['find_indexes', 'get_index', 'find_instruments']
+__all__ = ['find_indexes', 'prepare_index', 'get_index', 'find_instruments', 'find_all_indexes', 'check_all_updates',
+           'pds_check_updates']
 
 # %% ../../notebooks/api/02c_pds.apps.ipynb 3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+
 import pandas as pd
+from dateutil import parser
+from dateutil.parser import ParserError
+from fastcore.script import call_parse
+from fastcore.xtras import Path
+from requests import RequestException
+from .. import utils
 from ..config import config
-from .indexes import Index
+from .indexes import Index, latest_index_url
 
 # %% ../../notebooks/api/02c_pds.apps.ipynb 4
 def find_indexes(
@@ -18,15 +29,15 @@ def find_indexes(
     return config.list_indexes(instrument)
 
 # %% ../../notebooks/api/02c_pds.apps.ipynb 7
-def get_index(
+def prepare_index(
         instr: str,  # Dotted instrument index, e.g. cassini.iss
         index_name: str = '',  # Index name, for exmample 'moon_summary. Optional'
         # switch to refresh an index (i.e. download if update available).
         # Set to False for faster return time to avoid web scraping
         refresh: bool = True,  
         force: bool = False,  # switch off for faster return time.
-) -> pd.DataFrame:  # The PDS index convert to pandas DataFrame
-    """Example: get_index("cassini.iss", "index")"""
+) -> Index:  # The Index object with locally available TAB and Parquet files
+    "Get the `Index` object, after downloading or updating and converting the index if required."
     # I need to add the check_update switch to the constructor b/c of dynamic url setting that always
     # wants to go online to find the latest volume URL.
     if not index_name:
@@ -36,15 +47,145 @@ def get_index(
     if not index.local_table_path.exists() or force:
         index.download()
     elif refresh and index.update_available:
-        index.download()
-        print("An updated index is available. Downloading...")
+        print("An updated index is available. Downloading new records...")
+        index.incremental_update()
     if not index.local_parq_path.exists():
         index.convert_to_parquet()
-    return index.parquet
+    return index
+
+
+def get_index(
+        instr: str,  # Dotted instrument index, e.g. cassini.iss
+        index_name: str = '',  # Index name, for exmample 'moon_summary. Optional'
+        # switch to refresh an index (i.e. download if update available).
+        # Set to False for faster return time to avoid web scraping
+        refresh: bool = True,  
+        force: bool = False,  # switch off for faster return time.
+        columns: list = None,  # Only read these columns
+        # Row filters pushed down to the Parquet reader, e.g. [("VOLUME_ID", "==", "MROX_0001")]
+        filters: list = None,
+) -> pd.DataFrame:  # The PDS index convert to pandas DataFrame
+    """Example: get_index("cassini.iss", "index")
 
-# %% ../../notebooks/api/02c_pds.apps.ipynb 14
+    Use `columns` and `filters` to only load the part of a big index that you need.
+    """
+    index = prepare_index(instr, index_name, refresh=refresh, force=force)
+    return index.read_parquet(columns=columns, filters=filters)
+
+# %% ../../notebooks/api/02c_pds.apps.ipynb 16
 def find_instruments(
         mission: str,  # Mission string, e.g. "cassini"
 ) -> list:  # List of configured instrument names
     "Find existing instruments for a mission."
     return config.list_instruments(mission)
+
+# %% ../../notebooks/api/02c_pds.apps.ipynb 17
+def find_all_indexes() -> list:  # Dotted keys of all configured indexes, e.g. cassini.iss.index
+    "Find all indexes of all configured missions and instruments."
+    return [
+        f"{mission}.{instrument}.{index_name}"
+        for mission in config.missions
+        for instrument in find_instruments(mission)
+        for index_name in find_indexes(f"{mission}.{instrument}")
+    ]
+
+
+def _try(
+    func,  # Function doing network requests
+    *args,  # Arguments for `func`
+) -> tuple:  # The result of `func`, None if it failed, and the error message
+    try:
+        return func(*args), ""
+    except (RequestException, KeyError, IndexError, ValueError) as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def _latest_index_url(
+    key: str,  # Dotted key of an index without a fixed URL, e.g. mro.ctx.edr
+) -> str:
+    instrument, index_name = key.rsplit(".", 1)
+    # the update check always looks for a new volume, and stores what it finds
+    return latest_index_url(f"{instrument}.indexes.{index_name}", refresh=True)
+
+
+def _local_timestamp(
+    key: str,  # Full dotted key of an index, e.g. missions.mro.ctx.indexes.edr
+    url: str,  # URL of the index label
+) -> datetime:  # None if the index was never downloaded
+    "The timestamp `Index` would have, without creating the local folder of the index."
+    try:
+        return parser.parse(config.get_value(key).get("timestamp", ""))
+    except ParserError:
+        # downloaded before the timestamps were stored, like `Index` falls back to the label
+        label = Path(config.storage_root) / key.replace(".", "/") / str(url).split("/")[-1]
+        return datetime.fromtimestamp(label.stat().st_mtime) if label.exists() else None
+
+
+def check_all_updates(
+    max_concurrent: int = 16,  # Max number of requests running at the same time
+) -> pd.DataFrame:  # One row per index, with the local and remote timestamps and if it is stale
+    """Check all configured indexes for updates in one pass, without downloading anything.
+
+    The remote timestamps are compared to the ones in the config, no local folders are created.
+    Dynamic index URLs, like the ones of CTX and LROC, are scraped once per instrument,
+    then the timestamps of all indexes are requested concurrently over the pooled connections
+    of `utils.get_session`, so the check takes about as long as the slowest server.
+    `update_available` is True for stale and never downloaded indexes and missing if the
+    check failed, see the `error` column.
+    Use `prepare_index` to update the stale ones.
+    """
+    keys = find_all_indexes()
+    instruments = {key: key.rsplit(".", 1)[0] for key in keys}
+    urls = {
+        key: config.get_value(f"{instruments[key]}.indexes.{key.rsplit('.', 1)[1]}").get("url", "")
+        for key in keys
+    }
+    # one scrape per instrument, shared by all its indexes
+    dynamic = {instruments[key]: key for key in keys if not urls[key]}
+    with ThreadPoolExecutor(max_concurrent) as pool:
+        scrapes = dict(zip(dynamic, pool.map(partial(_try, _latest_index_url), dynamic.values())))
+        errors = {}
+        for key in keys:
+            if not urls[key]:
+                urls[key], errors[key] = scrapes[instruments[key]]
+        checked = [key for key in keys if urls[key]]
+        remote = dict(
+            zip(checked, pool.map(partial(_try, utils.get_remote_timestamp), [urls[key] for key in checked]))
+        )
+    rows = []
+    for key in keys:
+        timestamp = remote_timestamp = None
+        update = pd.NA
+        if urls[key]:
+            remote_timestamp, error = remote[key]
+            instrument, index_name = key.rsplit(".", 1)
+            timestamp = _local_timestamp(f"missions.{instrument}.indexes.{index_name}", urls[key])
+            if timestamp is None:
+                update = True  # never downloaded
+            elif remote_timestamp is not None:
+                update = remote_timestamp > timestamp
+        else:
+            error = errors[key]
+        rows.append(
+            dict(
+                index=key,
+                url=str(urls[key] or ""),
+                timestamp=timestamp,
+                remote_timestamp=remote_timestamp,
+                update_available=update,
+                error=error,
+            )
+        )
+    return pd.DataFrame(rows).set_index("index").astype({"update_available": "boolean"})
+
+
+@call_parse
+def pds_check_updates(
+    max_concurrent: int = 16,  # Max number of requests running at the same time
+    stale_only: bool = False,  # Only list the indexes with an update available
+):
+    "Print which of the configured indexes have updates available, see `check_all_updates`."
+    df = check_all_updates(max_concurrent)
+    if stale_only:
+        df = df[df.update_available.fillna(False)]
+    print(df.drop(columns="url").to_string())
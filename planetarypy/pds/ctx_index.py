@@ -6,31 +6,40 @@
 __all__ = ['CTXIndex']
 
 # %% ../../notebooks/api/02b_pds.ctx_index.ipynb 3
+import re
 from dataclasses import dataclass
 from ssl import SSLError
 from string import Template
 
+import pandas as pd
 from yarl import URL
 
-import pandas as pd
+from ..utils import list_links
 
 # %% ../../notebooks/api/02b_pds.ctx_index.ipynb 4
 class CTXIndex:
     url = 'https://planetarydata.jpl.nasa.gov/img/data/mro/mars_reconnaissance_orbiter/ctx/'
 
     def __init__(self):
-        self._volumes_table = None
+        self._volumes = None
+
+    @property
+    def volumes(self) -> list:  # Names of the volume folders, sorted by volume number
+        "Read from the link names of the archive's directory listing."
+        if self._volumes is None:
+            names = [name.rstrip('/') for name in list_links(self.url)]
+            volumes = [name for name in names if re.fullmatch(r'mrox_\d+', name)]
+            self._volumes = sorted(volumes, key=lambda name: int(name.split('_')[1]))
+        return self._volumes
 
     @property
-    def volumes_table(self):
-        if self._volumes_table is None:
-            self._volumes_table = pd.read_html(self.url)[0].dropna(
-                how='all', axis=1).dropna(how='all', axis=0).iloc[1:, :-1]
-        return self._volumes_table
+    def volumes_table(self) -> pd.DataFrame:
+        "Kept for compatibility, the `volumes` as folder names in the first column, like the listing."
+        return pd.DataFrame({'Name': [f'{name}/' for name in self.volumes]})
 
     @property
     def latest_release_folder(self):
-        return self.volumes_table.iloc[-2, 0]
+        return self.volumes[-1]
 
     @property
     def latest_release_number(self):
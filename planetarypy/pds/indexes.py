@@ -3,27 +3,33 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../notebooks/api/02a_pds.indexes.ipynb.
 
 # %% auto 0
-__all__ = ['logger', 'storage_root', 'dynamic_urls', 'Index']
+__all__ = ['logger', 'storage_root', 'dynamic_urls', 'default_record_fixups', 'latest_index_url', 'Index']
 
 # %% ../../notebooks/api/02a_pds.indexes.ipynb 3
 import logging
+import threading
 from datetime import datetime
+from typing import Union
 from urllib.parse import urlsplit, urlunsplit
-from urllib.request import URLError
+
 from dask import dataframe as dd
 import tomlkit as toml
 from dateutil import parser
 from dateutil.parser import ParserError
+from requests import RequestException
 from yarl import URL
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from fastcore.basics import patch  # better monkeypatcher
 from fastcore.xtras import Path  # improved pathlib.Path
 from .. import utils
 from ..config import config
 from .ctx_index import CTXIndex
 from .lroc_index import LROCIndex
-from .utils import IndexLabel, fix_hirise_edrcumindex, convert_times
+from .utils import IndexLabel, KeyLookup, convert_times, fix_records
+from .utils import optimize_parquet_layout, read_fixed_width, record_fixups
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +37,39 @@ storage_root = Path(config.storage_root)
 
 # %% ../../notebooks/api/02a_pds.indexes.ipynb 4
 dynamic_urls = {"mro.ctx": CTXIndex, "lro.lroc": LROCIndex}
+# record repairs an index needs while its config has no `record_fixups` value, see `pds.utils.record_fixups`
+default_record_fixups = {"missions.mro.hirise.indexes.edr": ["truncate_overlong_reals"]}
+_config_lock = threading.Lock()
+
+
+def latest_index_url(
+    key: str,  # Nested (dotted) key of an index without a fixed URL, e.g. mro.ctx.indexes.edr
+    refresh: bool = False,  # Switch to look up the latest URL even if the stored one is still valid
+) -> str:  # URL of the label of the latest index
+    """Find the index URL of instruments that add a new volume for every release, like CTX.
+
+    Finding it takes reading the archive's volume listing, so the result is stored as
+    `latest_url` in the index's config, and reused for `dynamic_url_ttl` seconds (default:
+    one day) before looking again.
+    """
+    key = key if key.startswith("missions") else "missions." + key
+    settings = config.get_value(key)
+    checked = settings.get("latest_url_checked", "")
+    ttl = settings.get("dynamic_url_ttl", "")
+    ttl = 24 * 3600 if ttl == "" else float(ttl)
+    if (
+        not refresh
+        and settings.get("latest_url")
+        and checked
+        and (datetime.now() - parser.parse(checked)).total_seconds() < ttl
+    ):
+        return settings["latest_url"]
+    instrument = ".".join(key.split(".")[1:3])
+    url = str(dynamic_urls[instrument]().latest_index_label_url)
+    with _config_lock:  # can be called from the threads of `apps.check_all_updates`
+        config.set_value(f"{key}.latest_url", url, save=False)
+        config.set_value(f"{key}.latest_url_checked", datetime.now().isoformat())
+    return url
 
 # %% ../../notebooks/api/02a_pds.indexes.ipynb 7
 class Index:
@@ -60,12 +99,14 @@ class Index:
             else:
                 self.timestamp = None
         self._remote_timestamp = None
+        self._key_lookups = {}
+        self._label = None
 
     def set_url(self, url):  # URL to index.
         """Set URL from having it dynamically determined (for non-static index URLs)."""
         self.url = config.get_value(self.key)["url"] if url is None else url
         if not self.url and self.check_update:  # empty ''
-            self.url = dynamic_urls[self.instrument_key]().latest_index_label_url
+            self.url = latest_index_url(self.key)
             
 
     @property
@@ -78,7 +119,7 @@ class Index:
             return self._remote_timestamp  # save the internet traffic if already checked before
         try:
             self._remote_timestamp = utils.get_remote_timestamp(self.url)
-        except URLError:
+        except (RequestException, KeyError):  # KeyError: no Last-Modified header
             print("Warning: Could not get the remote timestamp for update check.")
         return self._remote_timestamp
         
@@ -151,9 +192,53 @@ class Index:
     def local_parq_path(self):
         return self.local_table_path.with_suffix(".parq")
 
+    @property
+    def parquet_part_paths(self):
+        "Extra Parquet files with the records added by `incremental_update`."
+        parq = self.local_parq_path
+        return sorted(parq.parent.glob(f"{parq.stem}.part*{parq.suffix}"))
+
+    @property
+    def parquet_paths(self):
+        return [self.local_parq_path] + self.parquet_part_paths
+
     @property
     def parquet(self):
-        return pd.read_parquet(self.local_parq_path)
+        return self.read_parquet()
+
+    def read_parquet(
+        self,
+        columns: list = None,  # Only read these columns
+        # Row filters in pyarrow's DNF format, e.g. [("TARGET_NAME", "==", "MARS")].
+        # Time columns need to be compared with datetime objects, e.g. pd.Timestamp("2010-01-01").
+        filters: list = None,
+    ) -> pd.DataFrame:
+        """Read the converted index, with column projection and predicate pushdown.
+
+        The filters are applied using the row-group statistics of the Parquet files,
+        so row groups that can't match are not even read.
+        """
+        return pd.read_parquet(self.parquet_paths, columns=columns, filters=filters)
+
+    def key_lookup(
+        self,
+        key: str = "PRODUCT_ID",  # Column to look up records by
+    ) -> KeyLookup:
+        "Persistent lookup table for `key`, stored next to the TAB file."
+        if key not in self._key_lookups:
+            self._key_lookups[key] = KeyLookup(self.local_table_path, self.label, key)
+        return self._key_lookups[key]
+
+    def lookup(
+        self,
+        values,  # One key value or a list of them
+        key: str = "PRODUCT_ID",  # Column to look up records by
+    ) -> pd.DataFrame:
+        """Get the records for `values` of `key` without reading the full index.
+
+        Only works for indexes with fixed-width TAB files.
+        """
+        return self.key_lookup(key).get(values)
 
     def update_timestamp(self):
         # Note: the config object writes itself out after setting any value
@@ -161,18 +246,68 @@ class Index:
 
     @property
     def label(self):
-        return IndexLabel(self.local_label_path)
-
-    def read_index_data(self, do_convert_times=True):
-        df = self.label.read_index_data(do_convert_times=do_convert_times)
+        "The `IndexLabel` of this index, kept while the label file stays unchanged."
+        mtime = self.local_label_path.stat().st_mtime
+        if self._label is None or self._label_mtime != mtime:
+            self._label = IndexLabel(self.local_label_path)
+            self._label_mtime = mtime
+        return self._label
+
+    def read_index_data(self, do_convert_times=True, n_workers=1):
+        df = self.label.read_index_data(
+            do_convert_times=do_convert_times, n_workers=n_workers
+        )
         return df
 
-    def convert_to_parquet(self):
-        print("Reading index to memory for conversion to parquet. Will take up lots of memory for a bit.")
-        df = self.read_index_data()
-        df = df.convert_dtypes()
-        print("Storing into parquet.")
-        df.to_parquet(self.local_parq_path)
+    @property
+    def sort_by(self):
+        """Column(s) to sort the Parquet file by, from the `sort_by` config value of this index.
+
+        Empty if the records should be stored in TAB order.
+        """
+        return config.get_value(self.key).get("sort_by", "")
+
+    @property
+    def record_fixups(self):
+        """Names of `pds.utils.record_fixups` to repair broken records of this index with.
+
+        Read from the `record_fixups` config value of this index, applied while converting.
+        Unset (an empty string) falls back to the `default_record_fixups` of this index,
+        an empty list `[]` switches the repairs off.
+        """
+        fixups = config.get_value(self.key).get("record_fixups", "")
+        if fixups == "":
+            fixups = default_record_fixups.get(self.key, [])
+        return list(fixups)
+
+    def convert_to_parquet(
+        self,
+        streaming: bool = True,  # convert in batches with bounded memory, set False to do it in one go
+        batch_rows: int = 100_000,  # records per batch (i.e. per Parquet row group) when streaming
+        n_workers: int = 1,  # number of processes to decode the TAB file in parallel
+    ):
+        # a full conversion supersedes all parts from incremental updates
+        for path in self.parquet_part_paths:
+            path.unlink()
+        if streaming:
+            self.label.convert_to_parquet(
+                self.local_parq_path,
+                batch_rows=batch_rows,
+                n_workers=n_workers,
+                fixups=self.record_fixups,
+            )
+        else:
+            if self.record_fixups:
+                fix_records(self.local_table_path, self.label, self.record_fixups)
+            print("Reading index to memory for conversion to parquet. Will take up lots of memory for a bit.")
+            df = self.read_index_data(n_workers=n_workers)
+            # dtypes are already set from the label, so no `convert_dtypes` inference needed
+            schema = self.label.arrow_schema(df.select_dtypes("category").columns)
+            print("Storing into parquet.")
+            df.to_parquet(self.local_parq_path, schema=schema)
+        if self.sort_by:
+            print(f"Sorting parquet file by {self.sort_by}.")
+            optimize_parquet_layout(self.local_parq_path, self.sort_by, batch_rows)
         print("Finished. Enjoy your freshly baked PDS Index. :")
 
     def __str__(self):
@@ -215,20 +350,162 @@ def download(
     logger.info("Downloading %s.", self.table_url)
     utils.url_retrieve(self.table_url, self.local_table_path)
     print(f"Downloaded {self.local_label_path} and {self.local_table_path}")
-    # if (
-    #     self.key == "missions.mro.hirise.indexes.edr"
-    # ):  # HiRISE EDR index is broken on the PDS. Team knows.
-    #     print("Fixing broken EDR index...")
-    #     fix_hirise_edrcumindex(
-    #         self.local_table_path, self.local_table_path.with_name("temp.tab")
-    #     )
-    #     self.local_table_path.with_name("temp.tab").rename(self.local_table_path)
+    self._set_remote_last_offset(_last_record_offset(self.local_table_path))
     self.timestamp = self.remote_timestamp
     self.update_timestamp()
     if convert_to_parquet:
+        # broken records are repaired while converting
         self.convert_to_parquet()
+    elif self.record_fixups:
+        fix_records(self.local_table_path, self.label, self.record_fixups)
 
 # %% ../../notebooks/api/02a_pds.indexes.ipynb 10
+@patch
+def _first_new_row(
+    self:Index,
+) -> Union[int, None]:  # Row number of the first record of a new volume, None if not determinable
+    "Find where the records of volumes that are not yet in the Parquet files start."
+    label = self.label
+    if "VOLUME_ID" not in label.colnames:
+        return None
+    known = pd.read_parquet(self.parquet_paths, columns=["VOLUME_ID"]).VOLUME_ID.unique()
+    volumes = read_fixed_width(
+        self.local_table_path, label, do_convert_times=False, columns=["VOLUME_ID"]
+    ).VOLUME_ID
+    is_new = ~volumes.isin(known).to_numpy()
+    first = is_new.argmax() if is_new.any() else len(is_new)
+    # only a pure append of new volumes can be converted incrementally
+    return first if is_new[first:].all() else None
+
+
+def _last_record_offset(
+    path: Path,  # TAB file as served, before any record fixups
+) -> int:  # Byte offset of the last record
+    "Find where the last line of a file starts, without reading all of it."
+    size = path.stat().st_size
+    chunk = 2**16
+    with path.open("rb") as f:
+        while True:
+            start = max(size - chunk, 0)
+            f.seek(start)
+            data = f.read()
+            i = data.rfind(b"\n", 0, len(data) - 1)
+            if i >= 0 or start == 0:
+                return start + i + 1
+            chunk *= 2
+
+
+@patch
+def _remote_last_offset(
+    self:Index,
+    n_old: int,  # Number of records in the local TAB file
+) -> int:  # Byte offset of the last record of the remote TAB file at the last download or update
+    "Where the last known record starts in the remote TAB file, which fixups may have made longer."
+    offset = config.get_value(self.key).get("last_record_offset", "")
+    if offset == "":
+        # not stored by older versions, so assume the local records are unchanged
+        return (n_old - 1) * self.label.record_bytes
+    return int(offset)
+
+
+@patch
+def _set_remote_last_offset(self:Index, offset: int):
+    config.set_value(f"{self.key}.last_record_offset", offset)
+
+
+@patch
+def _repair_record(
+    self:Index,
+    record: bytes,  # One record as served
+) -> bytes:  # The record as stored in the local TAB file
+    "Apply the record fixups of this index to one record, like the conversion does."
+    for name in self.record_fixups:
+        if len(record) == self.label.record_bytes:
+            break
+        record = record_fixups[name](record, self.label)
+    return record
+
+
+@patch
+def incremental_update(
+    self:Index,  # the Index object defined in this module
+):
+    """Update a cumulative index by only getting and converting the newly appended records.
+
+    The new end of the TAB file is fetched with a HTTP Range request, starting with the last
+    known record to verify that the remote table only has grown. Its remote offset is stored
+    at every download and update, as the record fixups may have shortened the local records.
+    If the server doesn't support Range requests, the full TAB file is downloaded and, if the
+    old records have changed, the new records are determined by their VOLUME_ID.
+    The new records are stored as an extra Parquet part next to `local_parq_path`.
+    Falls back to `download` if the index changed in any other way.
+    """
+    if not (self.local_table_path.exists() and self.local_parq_path.exists()):
+        return self.download()
+    record_bytes = self.label.record_bytes
+    n_old = self.local_table_path.stat().st_size // record_bytes
+    if not n_old:
+        return self.download()
+    with self.local_table_path.open("rb") as f:
+        f.seek((n_old - 1) * record_bytes)
+        last_record = f.read(record_bytes)
+    last_offset = self._remote_last_offset(n_old)
+    logger.info("Downloading new records of %s.", self.table_url)
+    tail = utils.get_url_tail(self.table_url, last_offset)
+    if tail is None:
+        print("Server does not support Range requests, downloading full table.")
+        utils.url_retrieve(self.table_url, self.local_table_path)
+        with self.local_table_path.open("rb") as f:
+            f.seek(last_offset)
+            unchanged = self._repair_record(f.readline()) == last_record
+        new_last_offset = _last_record_offset(self.local_table_path)
+        if self.record_fixups:
+            fix_records(self.local_table_path, self.label, self.record_fixups)
+        # if the old records have been changed, at least add the new volumes
+        start_row = n_old if unchanged else self._first_new_row()
+    else:
+        first_end = tail.find(b"\n") + 1 or len(tail)
+        if self._repair_record(tail[:first_end]) != last_record:
+            print("Index has changed beyond appended records, doing full download.")
+            return self.download()
+        with self.local_table_path.open("ab") as f:
+            f.write(tail[first_end:])
+        start_row = n_old
+        new_last_offset = last_offset + tail.rfind(b"\n", 0, len(tail) - 1) + 1
+    utils.url_retrieve(self.url, self.local_label_path)
+    if start_row is None:
+        print("Could not determine the new records, converting the full index.")
+        self.convert_to_parquet()
+    else:
+        self._convert_new_records(start_row)
+    self._set_remote_last_offset(new_last_offset)
+    self.timestamp = self.remote_timestamp
+    self.update_timestamp()
+
+
+@patch
+def _convert_new_records(
+    self:Index,
+    start_row: int,  # Row number of the first record not yet in the Parquet files
+):
+    "Store records from `start_row` on as an extra Parquet part, with the categoricals of the main file."
+    n_new = self.local_table_path.stat().st_size // self.label.record_bytes - start_row
+    if n_new > 0:
+        n_parts = len(self.parquet_part_paths)
+        part_path = self.local_parq_path.with_suffix(f".part{n_parts + 1:03d}.parq")
+        schema = pq.read_schema(self.local_parq_path)
+        categoricals = [f.name for f in schema if pa.types.is_dictionary(f.type)]
+        self.label.convert_to_parquet(
+            part_path,
+            start_row=start_row,
+            categoricals=categoricals,
+            fixups=self.record_fixups,
+        )
+        if self.sort_by:
+            optimize_parquet_layout(part_path, self.sort_by)
+    print(f"Added {n_new} new records to {self.key}.")
+
+# %% ../../notebooks/api/02a_pds.indexes.ipynb 11
 @patch(as_prop=True)
 def update_available(
         self: Index) -> bool:  # Boolean indicating if there's a new index
@@ -6,27 +6,38 @@
 __all__ = ['LROCIndex']
 
 # %% ../../notebooks/api/02e_pds.lroc_index.ipynb 2
+import re
+import warnings
+
 import pandas as pd
 from yarl import URL
-import warnings
+
+from ..utils import list_links
 
 # %% ../../notebooks/api/02e_pds.lroc_index.ipynb 5
 class LROCIndex:
     edr_url = 'https://pds.lroc.asu.edu/data/LRO-L-LROC-2-EDR-V1.0/'
 
     def __init__(self):
-        self._volumes_table = None
+        self._volumes = None
+
+    @property
+    def volumes(self) -> list:  # Names of the volume folders, sorted
+        "Read from the link names of the archive's directory listing."
+        if self._volumes is None:
+            names = [name.rstrip('/') for name in list_links(self.edr_url)]
+            # e.g. LROLRC_0048C
+            self._volumes = sorted(name for name in names if re.fullmatch(r'LROLRC_\d+[A-Z]?', name))
+        return self._volumes
 
     @property
-    def volumes_table(self):
-        if self._volumes_table is None:
-            self._volumes_table = pd.read_html(self.edr_url)[0].dropna(
-                how='all', axis=1).dropna(how='all', axis=0).iloc[1:-1, :-1]
-        return self._volumes_table
+    def volumes_table(self) -> pd.DataFrame:
+        "Kept for compatibility, the `volumes` as folder names in the first column, like the listing."
+        return pd.DataFrame({'Name': [f'{name}/' for name in self.volumes]})
 
     @property
     def latest_release_folder(self):
-        return self.volumes_table.iloc[-1, 0]
+        return self.volumes[-1]
 
     @property
     def latest_release_number(self):
@@ -8,13 +8,14 @@ __all__ = ['base_url', 'metadata_url', 'image_url', 'dic', 'OPUSImageURL', 'OPUS
 # %% ../../notebooks/api/02d_pds.opusapi.ipynb 2
 from pathlib import Path
 from urllib.parse import urlencode, urlparse
-from urllib.request import unquote, urlretrieve
+from urllib.request import unquote
 
-import requests
 from IPython.display import HTML, display
 
 import pandas as pd
 
+from .. import utils
+
 base_url = "https://opus.pds-rings.seti.org/opus/api"
 metadata_url = base_url + "/metadata"
 image_url = base_url + "/image/"
@@ -141,7 +142,7 @@ class OPUS(object):
         elif kind == "images":
             url = "{}/images/{}.{}".format(base_url, size, fmt)
         self.url = url
-        self.r = requests.get(url, params=unquote(urlencode(query)))
+        self.r = utils.get_session().get(url, params=unquote(urlencode(query)))
 
     def create_files_request(self, query, fmt="json"):
         self.create_request_with_query("files", query, fmt=fmt)
@@ -152,7 +153,7 @@ class OPUS(object):
     def get_volume_id(self, ring_obsid):
         url = "{}/{}.json".format(metadata_url, ring_obsid)
         query = {"cols": "volumeidlist"}
-        r = requests.get(url, params=unquote(urlencode(query)))
+        r = utils.get_session().get(url, params=unquote(urlencode(query)))
         return r.json()[0]["volume_id_list"]
 
     # def create_data_request(self, query, fmt='json'):
@@ -276,9 +277,9 @@ class OPUS(object):
                 print("Downloading", basename)
                 store_path = str(pm.basepath / basename)
                 try:
-                    urlretrieve(url, store_path)
+                    utils.url_retrieve(url, store_path)
                 except Exception as e:
-                    urlretrieve(url.replace("https", "http"), store_path)
+                    utils.url_retrieve(url.replace("https", "http"), store_path)
             return str(pm.basepath)
 
     def download_previews(self, savedir=None):
@@ -295,4 +296,4 @@ class OPUS(object):
             pm.basepath.mkdir(exist_ok=True)
             basename = Path(obsid.medium_img_url).name
             print("Downloading", basename)
-            urlretrieve(obsid.medium_img_url, str(pm.basepath / basename))
+            utils.url_retrieve(obsid.medium_img_url, str(pm.basepath / basename))
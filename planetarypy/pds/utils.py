@@ -3,21 +3,57 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../notebooks/api/02f_pds.utils.ipynb.
 
 # %% auto 0
-__all__ = ['IndexLabel', 'convert_times', 'index_to_df', 'PVLColumn', 'decode_line', 'find_mixed_type_cols',
-           'fix_hirise_edrcumindex']
+__all__ = ['record_fixups', 'MISSING_INT', 'load_label', 'IndexLabel', 'convert_times', 'apply_label_dtypes', 'read_fixed_width',
+           'index_to_df', 'truncate_overlong_reals', 'iter_record_blocks', 'fix_records', 'fix_hirise_edrcumindex',
+           'iter_index_batches', 'index_to_parquet', 'optimize_parquet_layout', 'TabFile', 'KeyLookup', 'PVLColumn',
+           'RecordDecoder', 'decode_line', 'find_mixed_type_cols']
 
 # %% ../../notebooks/api/02f_pds.utils.ipynb 3
+import bisect
+import re
+import shutil
 import warnings
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
+from math import ceil
+from operator import itemgetter
 from typing import Union
 
+import numpy as np
 import pandas as pd
 import pvl
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from fastcore.utils import Path
 from tqdm.auto import tqdm
 
 from .. import utils
 
 # %% ../../notebooks/api/02f_pds.utils.ipynb 4
+_label_cache = {}
+
+
+def load_label(
+    path: Union[str, Path],  # Path to a PVL label file
+) -> pvl.PVLModule:
+    """Parse a PVL label file, cached process-wide by path and modification time.
+
+    Tools that open many labels, or the same label many times, only pay for parsing once,
+    while a changed file is parsed again.
+    Note that the returned object is shared, so don't modify it.
+    """
+    path = Path(path).absolute()
+    key = (path, path.stat().st_mtime_ns)
+    if key not in _label_cache:
+        # forget older versions of this file
+        for old in [k for k in _label_cache if k[0] == path]:
+            del _label_cache[old]
+        _label_cache[key] = pvl.load(str(path))
+    return _label_cache[key]
+
+# %% ../../notebooks/api/02f_pds.utils.ipynb 5
 class IndexLabel:
     "Support working with label files of PDS Index tables."
 
@@ -29,10 +65,14 @@ class IndexLabel:
         labelpath: Union[str, Path],
     ):
         self.path = Path(labelpath)
+        self._pvl_lbl = None
+        self._pvl_mtime = None
         "search for table name pointer and store key and fpath."
         tuple = [i for i in self.pvl_lbl if i[0].startswith("^")][0]
         self.tablename = tuple[0][1:]
         self.index_name = tuple[1]
+        self._time_columns = None
+        self._decoder = None
 
     @property
     def index_path(self):
@@ -46,7 +86,21 @@ class IndexLabel:
 
     @property
     def pvl_lbl(self):
-        return pvl.load(str(self.path))
+        "The parsed label, parsed again only if the label file changed."
+        mtime = self.path.stat().st_mtime_ns
+        if mtime != self._pvl_mtime:
+            self._pvl_lbl = load_label(self.path)
+            self._pvl_mtime = mtime
+            self._time_columns = None
+            self._decoder = None
+        return self._pvl_lbl
+
+    def __getstate__(self):
+        # parsed PVL objects can't be unpickled, so worker processes get the label
+        # from `load_label` again, usually from the inherited process-wide cache
+        state = self.__dict__.copy()
+        state.update(_pvl_lbl=None, _pvl_mtime=None, _decoder=None)
+        return state
 
     @property
     def table(self):
@@ -84,42 +138,364 @@ class IndexLabel:
                 colspecs.extend(pvlcol.colspecs)
         return colspecs
 
-    def read_index_data(self, do_convert_times=True):
-        return index_to_df(self.index_path, self, do_convert_times=do_convert_times)
+    @property
+    def data_types(self):
+        "DATA_TYPE for each column name in `colnames`, array columns repeated per item."
+        data_types = []
+        for col in self.pvl_columns:
+            pvlcol = PVLColumn(col)
+            data_types.extend([pvlcol.data_type] * len(pvlcol.name_as_list))
+        return data_types
+
+    @property
+    def time_columns(self):
+        """Names of columns that are converted to datetime objects, decided by `PVLColumn.is_time`.
 
-# %% ../../notebooks/api/02f_pds.utils.ipynb 5
-def convert_times(df):
-    for column in [col for col in df.columns if "TIME" in col]:
-        if column in ["LOCAL_TIME", "DWELL_TIME"]:
+        Determined once per label object, so all batches of an index are treated alike.
+        """
+        # reading `pvl_lbl` first drops the columns of an outdated label
+        if self.pvl_lbl is not None and self._time_columns is None:
+            self._time_columns = [
+                name
+                for col in self.pvl_columns
+                if PVLColumn(col).is_time
+                for name in PVLColumn(col).name_as_list
+            ]
+        return self._time_columns
+
+    @property
+    def dtypes(self):
+        """pandas dtypes for all columns, derived from the label's DATA_TYPE and BYTES.
+
+        Integers get the narrowest nullable type that can hold BYTES digits.
+        CHARACTER columns are declared as "string" here, `apply_label_dtypes` turns
+        them into categoricals if their cardinality is low.
+        """
+        dtypes = {}
+        time_columns = self.time_columns
+        for col in self.pvl_columns:
+            pvlcol = PVLColumn(col)
+            nbytes = pvlcol.item_bytes or pvlcol.pvlobj["BYTES"]
+            for name in pvlcol.name_as_list:
+                if name in time_columns:
+                    dtype = "datetime64[ns]"
+                elif pvlcol.data_type == "ASCII_INTEGER":
+                    dtype = _narrowest_int(nbytes)
+                elif pvlcol.data_type == "ASCII_REAL":
+                    dtype = "float64"
+                else:
+                    dtype = "string"
+                dtypes[name] = dtype
+        return dtypes
+
+    def arrow_schema(
+        self,
+        categoricals: list = (),  # Names of columns to be stored dictionary-encoded
+    ) -> pa.Schema:
+        "Arrow schema for the Parquet file of this index, built from `dtypes`."
+        fields = []
+        for name, dtype in self.dtypes.items():
+            if name in categoricals:
+                pa_type = pa.dictionary(pa.int32(), pa.string())
+            elif dtype == "string":
+                pa_type = pa.string()
+            elif dtype.startswith("datetime"):
+                pa_type = pa.timestamp("ns")
+            else:
+                pa_type = pa.from_numpy_dtype(np.dtype(dtype.lower()))
+            fields.append(pa.field(name, pa_type))
+        return pa.schema(fields)
+
+    @property
+    def record_bytes(self):
+        "Length of one record of the table, including the line terminator."
+        row_bytes = self.table.get("ROW_BYTES")
+        if row_bytes is None:
+            return self.pvl_lbl["RECORD_BYTES"]
+        return row_bytes + self.table.get("ROW_SUFFIX_BYTES", 0)
+
+    @property
+    def record_dtype(self):
+        """NumPy structured dtype mapping one table record to its raw byte fields.
+
+        Viewing the TAB file with this dtype gives access to every column
+        without any tokenizing.
+        """
+        colspecs = self.colspecs
+        return np.dtype(
+            {
+                "names": self.colnames,
+                "formats": [f"S{stop - start}" for start, stop in colspecs],
+                "offsets": [start for start, _ in colspecs],
+                "itemsize": self.record_bytes,
+            }
+        )
+
+    @property
+    def decoder(self):
+        "The `RecordDecoder` of this label, compiled once per label version."
+        # access `pvl_lbl` first, it resets the decoder if the label file changed
+        if self.pvl_lbl is not None and self._decoder is None:
+            self._decoder = RecordDecoder(self)
+        return self._decoder
+
+    def read_index_data(
+        self,
+        do_convert_times=True,
+        n_workers: int = 1,  # Number of processes to decode the table in parallel
+    ):
+        return index_to_df(
+            self.index_path, self, do_convert_times=do_convert_times, n_workers=n_workers
+        )
+
+    def convert_to_parquet(
+        self,
+        parqpath: Union[str, Path],  # Path of the Parquet file to write
+        batch_rows: int = 100_000,  # Number of records per batch, i.e. per Parquet row group
+        start_row: int = 0,  # Number of records to skip, e.g. the ones already converted
+        categoricals: list = None,  # Names of categorical columns, default: decided by the first batch
+        n_workers: int = 1,  # Number of processes to decode batches in parallel
+        fixups: list = (),  # Record fixups to repair broken records with, see `iter_record_blocks`
+    ):
+        index_to_parquet(
+            self.index_path,
+            self,
+            parqpath,
+            batch_rows=batch_rows,
+            start_row=start_row,
+            categoricals=categoricals,
+            n_workers=n_workers,
+            fixups=fixups,
+        )
+
+# %% ../../notebooks/api/02f_pds.utils.ipynb 6
+def convert_times(
+    df: pd.DataFrame,  # Dataframe with time string columns
+    columns: list = None,  # Columns to convert. Default: the `time_columns` of `label`
+    quiet: bool = False,  # suppress the feedback print, e.g. when converting in batches
+    label: IndexLabel = None,  # Label of the index, to find the time columns if `columns` is not given
+):
+    """Convert time string columns to datetime64, with one vectorized pass per column.
+
+    NASA and ISO times of any precision are parsed by `utils.nasa_times_to_datetime`,
+    only the few values in other formats (e.g. with a time zone) are left to pandas.
+    """
+    if columns is None:
+        if label is None:
+            raise ValueError("Either `columns` or a `label` to find the time columns is needed.")
+        columns = label.time_columns
+    for column in [col for col in columns if col in df.columns]:
+        times = utils.nasa_times_to_datetime(df[column])
+        if np.isnat(times).any():
+            strings = df[column].astype("string").str.strip()
+            rest = np.isnat(times) & (strings.fillna("") != "").to_numpy()
+            if rest.any():
+                other = pd.to_datetime(
+                    strings[rest], format="mixed", utc=True, errors="coerce"
+                )
+                times[rest] = other.dt.tz_localize(None).to_numpy("datetime64[ns]")
+        df[column] = times
+    if not quiet:
+        print("Convert time strings to datetime objects.")
+    return df
+
+# %% ../../notebooks/api/02f_pds.utils.ipynb 7
+def _narrowest_int(
+    nbytes: int,  # Number of bytes (i.e. digits incl. sign) of an ASCII_INTEGER field
+) -> str:  # Name of the smallest nullable pandas integer type holding all values
+    for dtype, max_digits in [("Int8", 2), ("Int16", 4), ("Int32", 9)]:
+        if nbytes <= max_digits:
+            return dtype
+    return "Int64"
+
+
+def apply_label_dtypes(
+    df: pd.DataFrame,  # Dataframe as read from a PDS TAB file
+    label: IndexLabel,  # Label object providing the `dtypes` of the columns
+    # Max ratio of unique values to rows for a string column to become categorical
+    categorical_threshold: float = 0.5,
+    # Names of string columns to make categorical, instead of deciding by `categorical_threshold`
+    categoricals: list = None,
+) -> pd.DataFrame:
+    """Cast columns to the dtypes declared by the label.
+
+    Time columns are left to `convert_times`.
+    When converting in batches, pass the `categoricals` found in the first batch
+    to get the same dtypes for all batches.
+    This replaces the expensive type inference of `DataFrame.convert_dtypes`.
+    """
+    for col, dtype in label.dtypes.items():
+        if col not in df.columns or dtype.startswith("datetime"):
             continue
+        if dtype == "string":
+            if categoricals is not None:
+                is_categorical = col in categoricals
+            else:
+                is_categorical = df[col].nunique() <= categorical_threshold * len(df)
+            dtype = "category" if is_categorical else dtype
+        try:
+            df[col] = df[col].astype(dtype)
+        except (TypeError, ValueError, OverflowError):
+            # label values can be wider than declared or blank, e.g. in broken index files
+            if dtype.startswith("Int") or dtype == "float64":
+                values = pd.to_numeric(df[col], errors="coerce")
+                is_int = dtype.startswith("Int") and (values.dropna() % 1 == 0).all()
+                df[col] = values.astype("Int64" if is_int else "Float64")
+            else:
+                df[col] = df[col].astype("string")
+    return df
+
+# %% ../../notebooks/api/02f_pds.utils.ipynb 8
+def _decode_column(
+    raw: np.ndarray,  # Array of raw bytes fields of one column
+    data_type: str,  # PDS DATA_TYPE of the column
+):
+    "Convert the raw bytes of one column according to its PDS DATA_TYPE."
+    if data_type in ["ASCII_REAL", "ASCII_INTEGER"]:
         try:
-            df[column] = pd.to_datetime(df[column])
+            return raw.astype(np.int64 if data_type == "ASCII_INTEGER" else np.float64)
         except ValueError:
-            df[column] = pd.to_datetime(
-                df[column], format=utils.nasa_dt_format_with_ms, errors="coerce"
-            )
-    print("Convert time strings to datetime objects.")
+            # blank or otherwise invalid fields, typically meaning "missing"
+            pass
+    values = np.char.decode(np.char.strip(raw, b'" '), "latin-1")
+    if data_type in ["ASCII_REAL", "ASCII_INTEGER"]:
+        return pd.to_numeric(values, errors="coerce")
+    return values
+
+
+def _map_records(
+    indexpath: Path,  # Path to the index TAB file
+    label: IndexLabel,  # Label object that describes the record layout
+) -> np.memmap:  # Structured array of all records, one bytes field per column
+    "Memory-map the TAB file with the record layout of the label."
+    record_bytes = label.record_bytes
+    if indexpath.stat().st_size % record_bytes:
+        raise ValueError(f"{indexpath} is not made of {record_bytes} bytes long records.")
+    # cheap sanity check that the record boundaries are where the label says
+    lines = np.memmap(indexpath, dtype=f"S{record_bytes}", mode="r")
+    if not (lines[0].endswith(b"\n") and lines[-1].endswith(b"\n")):
+        raise ValueError(f"Records of {indexpath} don't end at the expected byte.")
+    return np.memmap(indexpath, dtype=label.record_dtype, mode="r")
+
+
+def _records_to_df(
+    records: np.ndarray,  # Structured array of records as provided by `_map_records`
+    label: IndexLabel,  # Label object that provides column names and data types
+    columns: list = None,  # Subset of columns to decode, default all
+) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            name: _decode_column(records[name], data_type)
+            for name, data_type in zip(label.decoder.names, label.decoder.data_types)
+            if columns is None or name in columns
+        }
+    )
+
+
+def _read_record_range(args):
+    "Decode the records `start` to `stop` of a TAB file, also in a worker process."
+    indexpath, label, start, stop, columns, do_convert_times = args
+    records = _map_records(indexpath, label)[start:stop]
+    df = _records_to_df(records, label, columns=columns)
+    if do_convert_times:
+        df = convert_times(df, label.time_columns, quiet=True)
     return df
 
-# %% ../../notebooks/api/02f_pds.utils.ipynb 6
+
+def _iter_record_ranges(
+    indexpath: Path,  # Path to the index TAB file
+    label: IndexLabel,  # Label object that describes the record layout
+    ranges: list,  # (start, stop) record numbers of each part to decode
+    columns: list = None,  # Subset of columns to decode, default all
+    do_convert_times=True,  # Switch to control if to convert the label's `time_columns`
+    n_workers: int = 1,  # Number of worker processes
+):
+    """Yield the decoded, not yet typed, records of each range, in order.
+
+    Because all records have the same length, the ranges are independent byte ranges
+    of the file, so with `n_workers` > 1 they are decoded in a process pool.
+    At most 2 * `n_workers` ranges are in flight, keeping the memory bounded.
+    """
+    args = ((indexpath, label, start, stop, columns, do_convert_times) for start, stop in ranges)
+    if n_workers <= 1:
+        yield from map(_read_record_range, args)
+        return
+    with ProcessPoolExecutor(n_workers) as pool:
+        pending = deque()
+        for arg in args:
+            pending.append(pool.submit(_read_record_range, arg))
+            if len(pending) >= 2 * n_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def read_fixed_width(
+    # Path to the index TAB file
+    indexpath: Union[str, Path],
+    # Label object that provides column names, byte offsets and data types
+    label: IndexLabel,
+    # Switch to control if to convert the label's `time_columns` to datetime
+    do_convert_times=True,
+    columns: list = None,  # Subset of columns to read, default all
+    n_workers: int = 1,  # Number of processes to decode parts of the file in parallel
+) -> pd.DataFrame:
+    """Read a fixed-width PDS TAB file in one pass, driven by the label.
+
+    The file is memory-mapped as a NumPy structured array built from `label.record_dtype`,
+    so each column is just a strided view on the raw bytes.
+    Every column is converted once according to its DATA_TYPE and `label.dtypes`,
+    no CSV tokenizing is done.
+    With `n_workers` > 1, the file is split into record-aligned parts that are decoded
+    in parallel and concatenated.
+    Raises ValueError if the file does not consist of records of `label.record_bytes` length.
+    """
+    indexpath = Path(indexpath)
+    n_records = len(_map_records(indexpath, label))
+    # a few parts per worker balance the load
+    n_parts = max(1, min(n_records, 4 * n_workers if n_workers > 1 else 1))
+    bounds = np.linspace(0, n_records, n_parts + 1).astype(int)
+    parts = _iter_record_ranges(
+        indexpath,
+        label,
+        list(zip(bounds[:-1], bounds[1:])),
+        columns=columns,
+        do_convert_times=do_convert_times,
+        n_workers=n_workers,
+    )
+    df = pd.concat(list(parts), ignore_index=True)
+    df = apply_label_dtypes(df, label)
+    if do_convert_times:
+        print("Convert time strings to datetime objects.")
+    return df
+
+# %% ../../notebooks/api/02f_pds.utils.ipynb 9
 def index_to_df(
     # Path to the index TAB file
     indexpath: Union[str, Path],
     # Label object that has both the column names and the columns widths as attributes
     # 'colnames' and 'colspecs'
     label: IndexLabel,
-    # Switch to control if to convert columns with "TIME" in name (unless COUNT is as well in name) to datetime
+    # Switch to control if to convert the label's `time_columns` to datetime
     do_convert_times=True,
+    n_workers: int = 1,  # Number of processes to decode fixed-width files in parallel
 ):
     """The main reader function for PDS Indexfiles.
 
     In conjunction with an IndexLabel object that figures out the column widths,
     this reader should work for all PDS TAB files.
+    Fixed-width tables are read with `read_fixed_width`, in `n_workers` processes if wanted,
+    anything not matching the label's record layout falls back to reading it as CSV.
     """
     indexpath = Path(indexpath)
-    # get n_lines fast for progress bar
-    with open(indexpath, "rb") as f:  # courtesy of https://stackoverflow.com/a/1019572
-        num_lines = sum(1 for _ in f)
+    try:
+        return read_fixed_width(
+            indexpath, label, do_convert_times=do_convert_times, n_workers=n_workers
+        )
+    except ValueError as e:
+        warnings.warn(f"{e} Falling back to reading as CSV.")
+    # estimate n_lines from the file size for progress bar
+    num_lines = indexpath.stat().st_size // label.record_bytes
     chunksize = 5000
     df = pd.concat(
         [
@@ -133,11 +509,568 @@ def index_to_df(
             )
         ]
     )
+    df = apply_label_dtypes(df.reset_index(drop=True), label)
     if do_convert_times:
-        df = convert_times(df)
+        df = convert_times(df, label.time_columns)
     return df
 
-# %% ../../notebooks/api/02f_pds.utils.ipynb 7
+# %% ../../notebooks/api/02f_pds.utils.ipynb 10
+# the rest of a field that runs past its column, up to the next delimiter
+_field_overflow_re = re.compile(rb"[^,\r\n]*")
+
+
+def truncate_overlong_reals(
+    record: bytes,  # One record that doesn't have the label's record length
+    label: IndexLabel,  # Label object that describes the record layout
+) -> bytes:  # The record with the extra fraction digits of ASCII_REAL fields cut off
+    """Cut ASCII_REAL values that are wider than their column back to the declared BYTES.
+
+    E.g. the HiRISE EDRCUMINDEX has some SCAN_EXPOSURE_DURATION values of format F10.4
+    instead of the declared F9.4, so 20000.0000 becomes 20000.000.
+    Only fraction digits are cut, so the value stays the same up to the declared precision.
+    """
+    decoder = label.decoder
+    for data_type, s in zip(decoder.data_types, decoder.slices):
+        if data_type != "ASCII_REAL":
+            continue
+        end = _field_overflow_re.match(record, s.stop).end()
+        extra = record[s.stop : end]
+        if extra and extra.isdigit() and b"." in record[s.start : s.stop]:
+            record = record[: s.stop] + record[end:]
+    return record
+
+
+# fixups that can be named in the `record_fixups` list of an index in the config file
+record_fixups = {
+    "truncate_overlong_reals": truncate_overlong_reals,
+}
+
+
+def _fix_block(
+    block: bytes,  # Complete lines of a TAB file
+    label: IndexLabel,  # Label object that describes the record layout
+    fixups: list,  # Functions that take a broken record and the label, returning the fixed record
+    first_row: int,  # Record number of the first line in `block`, for error messages
+) -> bytes:  # `block` itself if all records have the right length, otherwise a fixed copy
+    record_bytes = label.record_bytes
+    ends = np.flatnonzero(np.frombuffer(block, dtype=np.uint8) == ord("\n")) + 1
+    if len(ends) == 0 or ends[-1] != len(block):
+        ends = np.append(ends, len(block))  # last line without line terminator
+    starts = np.concatenate([[0], ends[:-1]])
+    broken = np.flatnonzero(ends - starts != record_bytes)
+    if not len(broken):
+        return block
+    pieces = []
+    done = 0
+    for i in broken:
+        record = block[starts[i] : ends[i]]
+        for fixup in fixups:
+            if len(record) == record_bytes:
+                break
+            record = fixup(record, label)
+        if len(record) != record_bytes:
+            raise ValueError(
+                f"Record {first_row + i} doesn't have the label's {record_bytes} bytes, "
+                "even after applying the record fixups."
+            )
+        pieces.extend([block[done : starts[i]], record])
+        done = ends[i]
+    pieces.append(block[done:])
+    return b"".join(pieces)
+
+
+def iter_record_blocks(
+    indexpath: Union[str, Path],  # Path to the index TAB file
+    label: IndexLabel,  # Label object that describes the record layout
+    fixups: list = (),  # Functions or names of `record_fixups` to repair broken records with
+    block_records: int = 100_000,  # Number of records to read per block
+    start_row: int = 0,  # Number of records to skip, they are still checked though
+):
+    """Yield the records of a TAB file in blocks, as structured arrays of `label.record_dtype`.
+
+    The file is read in large binary blocks and the lengths of all lines of a block are checked
+    at once, only the records that don't have `label.record_bytes` length go through the
+    `fixups`, in order, until one fixes them.
+    If any record was fixed, the repaired file replaces `indexpath` after the last block,
+    so it can be memory-mapped afterwards, e.g. by `TabFile` or `KeyLookup`.
+    A file without broken records is only read.
+    """
+    indexpath = Path(indexpath)
+    fixups = [record_fixups[f] if isinstance(f, str) else f for f in fixups]
+    decoder = label.decoder
+    fixedpath = indexpath.with_suffix(".fixed")
+    fixed_file = None
+    row = 0
+    rest = b""
+    try:
+        with indexpath.open("rb") as f:
+            while True:
+                chunk = f.read(block_records * label.record_bytes)
+                data = rest + chunk
+                # end blocks at a line end, the rest is completed by the next chunk
+                cut = data.rfind(b"\n") + 1 if chunk else len(data)
+                block, rest = data[:cut], data[cut:]
+                if not block:
+                    if chunk:
+                        continue
+                    break
+                fixed = _fix_block(block, label, fixups, row)
+                if fixed is not block and fixed_file is None:
+                    # start the repaired file with the good records read so far
+                    fixed_file = fixedpath.open("wb")
+                    with indexpath.open("rb") as head:
+                        fixed_file.write(head.read(row * label.record_bytes))
+                if fixed_file is not None:
+                    fixed_file.write(fixed)
+                records = decoder.records(fixed)
+                if row + len(records) > start_row:
+                    yield records[max(0, start_row - row) :]
+                row += len(records)
+    except BaseException:
+        if fixed_file is not None:
+            fixed_file.close()
+            fixedpath.unlink()
+        raise
+    if fixed_file is not None:
+        fixed_file.close()
+        fixedpath.replace(indexpath)
+        print(f"Fixed broken records of {indexpath}.")
+
+
+def fix_records(
+    indexpath: Union[str, Path],  # Path to the index TAB file
+    label: IndexLabel,  # Label object that describes the record layout
+    fixups: list,  # Functions or names of `record_fixups` to repair broken records with
+):
+    "Repair the broken records of a TAB file in place, without decoding it, see `iter_record_blocks`."
+    for _ in iter_record_blocks(indexpath, label, fixups):
+        pass
+
+
+def fix_hirise_edrcumindex(
+    infname: Union[str, Path],  # Path to broken EDRCUMINDEX.TAB
+    outfname: Union[str, Path],  # Path where to store the fixed TAB file
+    label: IndexLabel = None,  # Label object of the index, default: read from EDRCUMINDEX.LBL next to `infname`
+):
+    """Fix HiRISE EDRCUMINDEX.
+
+    Deprecated: the HiRISE EDR `Index` repairs its records while converting, otherwise use
+    `fix_records` with the `truncate_overlong_reals` fixup.
+    """
+    warnings.warn(
+        "`fix_hirise_edrcumindex` is deprecated, use `fix_records` with `truncate_overlong_reals`.",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    infname, outfname = Path(infname), Path(outfname)
+    if label is None:
+        label = IndexLabel(infname.with_suffix(".LBL"))
+    if outfname != infname:
+        shutil.copyfile(infname, outfname)
+    fix_records(outfname, label, ["truncate_overlong_reals"])
+
+# %% ../../notebooks/api/02f_pds.utils.ipynb 11
+def iter_index_batches(
+    # Path to the index TAB file
+    indexpath: Union[str, Path],
+    # Label object that provides column names, byte offsets and data types
+    label: IndexLabel,
+    batch_rows: int = 100_000,  # Number of records per batch
+    # Switch to control if to convert the label's `time_columns` to datetime
+    do_convert_times=True,
+    start_row: int = 0,  # Number of records to skip, e.g. the ones already converted
+    categoricals: list = None,  # Names of categorical columns, default: decided by the first batch
+    n_workers: int = 1,  # Number of processes to decode batches in parallel
+    fixups: list = (),  # Record fixups to repair broken records with, see `iter_record_blocks`
+):
+    """Iterate over a PDS TAB file in typed dataframes of `batch_rows` records.
+
+    Only one batch (or, with `n_workers` > 1, a few per worker) is held in memory at a time.
+    Categorical columns are determined from the first batch and used for all following batches,
+    so that all batches share the same dtypes.
+    Only fixed-width files are decoded in parallel, the CSV fallback reads sequentially.
+    With `fixups`, the file is read in blocks by `iter_record_blocks`, which repairs broken
+    records in the same pass.
+    """
+    indexpath = Path(indexpath)
+    if fixups:
+        blocks = iter_record_blocks(
+            indexpath, label, fixups, block_records=batch_rows, start_row=start_row
+        )
+        batches = (_records_to_df(records, label) for records in blocks)
+        times_converted = False
+    else:
+        try:
+            n_records = len(_map_records(indexpath, label))
+            ranges = [
+                (i, min(i + batch_rows, n_records))
+                for i in range(start_row, n_records, batch_rows)
+            ]
+            batches = _iter_record_ranges(
+                indexpath,
+                label,
+                ranges,
+                do_convert_times=do_convert_times,
+                n_workers=n_workers,
+            )
+            times_converted = do_convert_times
+        except ValueError as e:
+            warnings.warn(f"{e} Falling back to reading as CSV.")
+            batches = pd.read_csv(
+                indexpath,
+                header=None,
+                names=label.colnames,
+                chunksize=batch_rows,
+                skiprows=start_row,
+            )
+            times_converted = False
+    for df in batches:
+        df = apply_label_dtypes(
+            df.reset_index(drop=True), label, categoricals=categoricals
+        )
+        if categoricals is None:
+            categoricals = list(df.select_dtypes("category").columns)
+        if do_convert_times and not times_converted:
+            df = convert_times(df, label.time_columns, quiet=True)
+        yield df
+
+
+def index_to_parquet(
+    # Path to the index TAB file
+    indexpath: Union[str, Path],
+    # Label object that provides column names, byte offsets and data types
+    label: IndexLabel,
+    parqpath: Union[str, Path],  # Path of the Parquet file to write
+    batch_rows: int = 100_000,  # Number of records per batch, i.e. per Parquet row group
+    start_row: int = 0,  # Number of records to skip, e.g. the ones already converted
+    categoricals: list = None,  # Names of categorical columns, default: decided by the first batch
+    n_workers: int = 1,  # Number of processes to decode batches in parallel
+    fixups: list = (),  # Record fixups to repair broken records with, see `iter_record_blocks`
+):
+    """Convert a PDS TAB file to Parquet with bounded memory.
+
+    The table is read with `iter_index_batches` and every batch is appended as one row group
+    to the same Parquet file, so peak memory does not depend on the size of the index.
+    With `n_workers` > 1 the batches are decoded in parallel, while writing stays in order.
+    """
+    indexpath = Path(indexpath)
+    n_rows = indexpath.stat().st_size / label.record_bytes - start_row
+    n_batches = ceil(n_rows / batch_rows)
+    writer = None
+    try:
+        for df in tqdm(
+            iter_index_batches(
+                indexpath,
+                label,
+                batch_rows=batch_rows,
+                start_row=start_row,
+                categoricals=categoricals,
+                n_workers=n_workers,
+                fixups=fixups,
+            ),
+            total=n_batches,
+            desc="Converting index in batches",
+        ):
+            if writer is None:
+                schema = label.arrow_schema(df.select_dtypes("category").columns)
+            table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+            if writer is None:
+                # the schema of the first table carries the pandas metadata
+                writer = pq.ParquetWriter(parqpath, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+# %% ../../notebooks/api/02f_pds.utils.ipynb 12
+def _sort_indices(
+    table: pa.Table,  # Table to sort
+    sort_by: list,  # Column names to sort by, in order of precedence
+) -> pa.Array:
+    # Arrow can't sort dictionary arrays directly, so sort on their decoded values
+    keys = pa.table(
+        [
+            col.cast(col.type.value_type) if pa.types.is_dictionary(col.type) else col
+            for col in table.select(sort_by).columns
+        ],
+        names=sort_by,
+    )
+    return pc.sort_indices(keys, sort_keys=[(c, "ascending") for c in sort_by])
+
+
+def _row_key(
+    table: pa.Table,  # Table sorted by `sort_by`
+    sort_by: list,  # Column names the table is sorted by
+    i: int,  # Row number
+) -> tuple:
+    "Sort key of a row in Python, with missing values last, like `pc.sort_indices`."
+    values = (table[name][i].as_py() for name in sort_by)
+    return tuple((True, 0) if value is None else (False, value) for value in values)
+
+
+def _merge_sorted_runs(
+    runs: list,  # Paths of Parquet files, each sorted by `sort_by`
+    sort_by: list,  # Column names the runs are sorted by
+    writer: pq.ParquetWriter,  # Writer of the merged file
+    row_group_rows: int,  # Number of records per row group of the merged file
+):
+    "Merge the sorted runs, holding only a chunk of each run and one row group in memory."
+    chunk_rows = max(row_group_rows // len(runs), 1000)
+    readers = [pq.ParquetFile(run).iter_batches(batch_size=chunk_rows) for run in runs]
+    buffers = [None] * len(runs)
+    merged = []
+    while True:
+        # refill the buffers of the runs that were used up
+        for i, reader in enumerate(readers):
+            if reader is not None and not buffers[i]:
+                batch = next(reader, None)
+                if batch is None:
+                    readers[i] = None
+                else:
+                    buffers[i] = pa.Table.from_batches([batch])
+        active = [buffer for buffer in buffers if buffer]
+        if not active:
+            break
+        # rows up to the smallest last key of the runs with unread rows can't be preceded
+        # by any unread row
+        last_keys = [
+            _row_key(buffer, sort_by, len(buffer) - 1)
+            for buffer, reader in zip(buffers, readers)
+            if reader is not None and buffer
+        ]
+        frontier = min(last_keys) if last_keys else None
+        ready = []
+        for i, buffer in enumerate(buffers):
+            if not buffer:
+                continue
+            n = len(buffer)
+            if frontier is not None:
+                n = bisect.bisect_right(
+                    range(len(buffer)), frontier, key=lambda j: _row_key(buffer, sort_by, j)
+                )
+            ready.append(buffer.slice(0, n))
+            buffers[i] = buffer.slice(n)
+        ready = pa.concat_tables(ready)
+        merged.append(ready.take(_sort_indices(ready, sort_by)))
+        if sum(map(len, merged)) >= row_group_rows:
+            merged = [_write_row_groups(writer, pa.concat_tables(merged), row_group_rows)]
+    if merged:
+        writer.write_table(pa.concat_tables(merged), row_group_size=row_group_rows)
+
+
+def _write_row_groups(
+    writer: pq.ParquetWriter,  # Writer to add the row groups to
+    table: pa.Table,  # Records to write
+    row_group_rows: int,  # Number of records per row group
+) -> pa.Table:  # Rest of the records that don't fill a row group
+    n = len(table) // row_group_rows * row_group_rows
+    writer.write_table(table.slice(0, n), row_group_size=row_group_rows)
+    return table.slice(n)
+
+
+def optimize_parquet_layout(
+    parqpath: Union[str, Path],  # Path of the Parquet file to rewrite
+    sort_by: Union[str, list],  # Column name(s) to sort the records by, e.g. PRODUCT_ID or START_TIME
+    row_group_rows: int = 100_000,  # Max number of records per row group
+):
+    """Rewrite a Parquet file sorted by `sort_by` with bounded row groups.
+
+    Together with the per-column statistics and dictionary encoding, sorted row groups have
+    narrow min/max ranges for the sort key, so point lookups and range scans with `filters`
+    can skip most of the file.
+    The sorting is done in bounded memory, like the conversion: every `row_group_rows` records
+    are sorted into a temporary run file, and the runs are merged chunk by chunk.
+    """
+    parqpath = Path(parqpath)
+    sort_by = [sort_by] if isinstance(sort_by, str) else list(sort_by)
+    rundir = parqpath.with_suffix(".runs")
+    tmppath = parqpath.with_suffix(".tmp")
+    rundir.mkdir(exist_ok=True)
+    try:
+        runs = []
+        for batch in pq.ParquetFile(parqpath).iter_batches(batch_size=row_group_rows):
+            run = pa.Table.from_batches([batch])
+            runs.append(rundir / f"run{len(runs):05d}.parq")
+            pq.write_table(run.take(_sort_indices(run, sort_by)), runs[-1])
+        if not runs:
+            return
+        schema = pq.read_schema(parqpath)
+        with pq.ParquetWriter(
+            tmppath, schema, use_dictionary=True, write_statistics=True
+        ) as writer:
+            _merge_sorted_runs(runs, sort_by, writer, row_group_rows)
+        tmppath.replace(parqpath)
+    finally:
+        shutil.rmtree(rundir)
+
+# %% ../../notebooks/api/02f_pds.utils.ipynb 13
+class TabFile:
+    """Memory-mapped random access to the records of a fixed-width PDS TAB file.
+
+    Records are located by their number alone, because they all have `label.record_bytes`
+    length, so getting any record is instant, independent of the size of the file.
+    Index like a sequence: an int gives a Series, a slice, list or boolean mask gives a
+    DataFrame indexed by record number. The fields are decoded and typed with the label.
+    """
+
+    def __init__(
+        self,
+        label: Union[IndexLabel, str, Path],  # Label object or path to the label file
+        indexpath: Union[str, Path] = None,  # Path to the TAB file, default: `label.index_path`
+        do_convert_times=True,  # Switch to control if to convert the label's `time_columns`
+    ):
+        self.label = label if isinstance(label, IndexLabel) else IndexLabel(label)
+        self.path = Path(indexpath) if indexpath is not None else self.label.index_path
+        self.do_convert_times = do_convert_times
+        self.records = _map_records(self.path, self.label)
+
+    def __len__(self):
+        return len(self.records)
+
+    def _record_numbers(self, key) -> np.ndarray:
+        if isinstance(key, slice):
+            return np.arange(*key.indices(len(self)))
+        key = np.asarray(key)
+        if key.dtype == bool:
+            return np.flatnonzero(key)
+        return np.where(key < 0, key + len(self), key)
+
+    def raw(
+        self,
+        i: int,  # Record number
+    ) -> bytes:  # The undecoded record
+        return self.records[i].tobytes()
+
+    def __getitem__(self, key):
+        if np.ndim(key) == 0 and not isinstance(key, slice):
+            return self[[key]].iloc[0]
+        rows = self._record_numbers(key)
+        # decide no categoricals, a few records don't tell about the full column
+        df = _records_to_df(self.records[rows], self.label)
+        df = apply_label_dtypes(df, self.label, categoricals=[])
+        if self.do_convert_times:
+            df = convert_times(df, self.label.time_columns, quiet=True)
+        df.index = rows
+        return df
+
+    def sample(
+        self,
+        n: int,  # Number of records
+        seed: int = None,  # Seed for the random generator, for reproducible samples
+    ) -> pd.DataFrame:
+        "Random sample of `n` records, in file order."
+        rng = np.random.default_rng(seed)
+        return self[np.sort(rng.choice(len(self), size=min(n, len(self)), replace=False))]
+
+    def __repr__(self):
+        return f"TabFile({self.path}, {len(self)} records)"
+
+# %% ../../notebooks/api/02f_pds.utils.ipynb 14
+class KeyLookup:
+    """Persistent lookup table from a key column, e.g. PRODUCT_ID, to record numbers of a TAB file.
+
+    The sorted keys and their record numbers are stored as `.npy` files next to the index
+    and memory-mapped, so finding a key is a binary search on disk that only touches a few pages.
+    Because the TAB records have a fixed length, the found records are then read directly
+    from their byte offset, without loading the full index.
+    The lookup table is rebuilt automatically if the TAB file is newer, e.g. after an update.
+    Only works for fixed-width TAB files (see `read_fixed_width`).
+    """
+
+    def __init__(
+        self,
+        indexpath: Union[str, Path],  # Path to the index TAB file
+        label: IndexLabel,  # Label object that describes the record layout
+        key: str = "PRODUCT_ID",  # Name of the column to look up
+    ):
+        self.indexpath = Path(indexpath)
+        self.label = label
+        self.key = key
+        self._keys = None
+        self._rows = None
+
+    @property
+    def keys_path(self):
+        return self.indexpath.with_suffix(f".{self.key}.keys.npy")
+
+    @property
+    def rows_path(self):
+        return self.indexpath.with_suffix(f".{self.key}.rows.npy")
+
+    @property
+    def is_current(self):
+        "True if the stored lookup table is not older than the TAB file."
+        return (
+            self.keys_path.exists()
+            and self.rows_path.exists()
+            and self.keys_path.stat().st_mtime >= self.indexpath.stat().st_mtime
+        )
+
+    def build(self):
+        "Store the sorted keys and their record numbers next to the TAB file."
+        keys = np.char.strip(_map_records(self.indexpath, self.label)[self.key], b'" ')
+        order = np.argsort(keys, kind="stable")
+        np.save(self.rows_path, order.astype(np.int64))
+        # keys last, so that its mtime marks a complete lookup table
+        np.save(self.keys_path, keys[order])
+        self._keys = None
+
+    @property
+    def keys(self) -> np.ndarray:  # Memory-mapped sorted keys
+        if not self.is_current:
+            self.build()
+        if self._keys is None:
+            self._keys = np.load(self.keys_path, mmap_mode="r")
+            self._rows = np.load(self.rows_path, mmap_mode="r")
+        return self._keys
+
+    def find(
+        self,
+        values,  # One key value or a list of them
+    ) -> np.ndarray:  # Record numbers of `values`, -1 for the ones not found
+        keys = self.keys
+        values = np.char.encode(np.atleast_1d(np.asarray(values, dtype=str)), "latin-1")
+        if not len(keys):
+            return np.full(len(values), -1)
+        pos = np.searchsorted(keys, values.astype(keys.dtype))
+        pos = np.minimum(pos, len(keys) - 1)
+        return np.where(keys[pos] == values, self._rows[pos], -1)
+
+    def find_prefix(
+        self,
+        prefix: str,  # Start of a key value, e.g. the short form of a CTX PRODUCT_ID
+    ) -> int:  # Record number of the first key starting with `prefix`, -1 if there is none
+        keys = self.keys
+        prefix = prefix.encode("latin-1")
+        pos = np.searchsorted(keys, np.array(prefix, dtype=keys.dtype))
+        if pos < len(keys) and keys[pos].startswith(prefix):
+            return int(self._rows[pos])
+        return -1
+
+    def read(
+        self,
+        rows,  # Record number(s), e.g. as returned by `find`
+        do_convert_times=True,  # Switch to control if to convert the label's `time_columns`
+    ) -> pd.DataFrame:  # The records, indexed by their record number
+        "Read only the given records from the TAB file."
+        tab = TabFile(self.label, self.indexpath, do_convert_times=do_convert_times)
+        return tab[np.atleast_1d(rows)]
+
+    def get(
+        self,
+        values,  # One key value or a list of them
+        do_convert_times=True,  # Switch to control if to convert the label's `time_columns`
+    ) -> pd.DataFrame:  # Records of the found `values`
+        rows = self.find(values)
+        return self.read(rows[rows >= 0], do_convert_times=do_convert_times)
+
+# %% ../../notebooks/api/02f_pds.utils.ipynb 15
+# a documented date format, e.g. YYYY-DDDThh:mm:ss.sss or yyyy-mm-dd
+_date_format_re = re.compile(r"YYYY-(DDD|DOY|MM-DD)", re.IGNORECASE)
+# hints that a column holds no date, but e.g. a local time or a duration
+_no_date_re = re.compile(r"\b(local|clock|duration|dwell)\b", re.IGNORECASE)
+
+
 class PVLColumn:
     "Manages just one of the columns in a table that is described via PVL."
 
@@ -165,6 +1098,31 @@ class PVLColumn:
     def stop(self):
         return self.start + self.pvlobj["BYTES"]
 
+    @property
+    def data_type(self):
+        return self.pvlobj.get("DATA_TYPE", "CHARACTER")
+
+    @property
+    def description(self):
+        "DESCRIPTION of the column, with whitespace normalized."
+        return " ".join(str(self.pvlobj.get("DESCRIPTION", "")).split())
+
+    @property
+    def is_time(self):
+        """Decide from the label if the column holds dates or date-times.
+
+        Declared TIME and DATE columns do, CHARACTER columns if their DESCRIPTION
+        documents a date format (e.g. YYYY-DDDThh:mm:ss) and nothing in it hints at a
+        local time, clock count or duration. The column name is not considered.
+        """
+        if self.data_type in ["TIME", "DATE"]:
+            return True
+        return (
+            self.data_type == "CHARACTER"
+            and _date_format_re.search(self.description) is not None
+            and _no_date_re.search(self.description) is None
+        )
+
     @property
     def items(self):
         return self.pvlobj.get("ITEMS")
@@ -177,86 +1135,217 @@ class PVLColumn:
     def item_offset(self):
         return self.pvlobj.get("ITEM_OFFSET")
 
-    @property
+    @cached_property
     def colspecs(self):
+        "(start, stop) byte offsets of the column, a list of them for array columns."
         if self.items is None:
             return (self.start, self.stop)
         else:
-            i = 0
-            bucket = []
-            for _ in range(self.items):
-                off = self.start + self.item_offset * i
-                bucket.append((off, off + self.item_bytes))
-                i += 1
-            return bucket
+            offsets = [self.start + self.item_offset * i for i in range(self.items)]
+            return [(off, off + self.item_bytes) for off in offsets]
+
+    @cached_property
+    def slices(self) -> list:  # One slice per item, just one for scalar columns
+        specs = [self.colspecs] if self.items is None else self.colspecs
+        return [slice(start, stop) for start, stop in specs]
 
     def decode(self, linedata):
         if self.items is None:
-            start, stop = self.colspecs
-            return linedata[start:stop]
+            return linedata[self.slices[0]]
         else:
-            bucket = []
-            for start, stop in self.colspecs:
-                bucket.append(linedata[start:stop])
-            return bucket
+            return [linedata[s] for s in self.slices]
 
     def __repr__(self):
         return self.pvlobj.__repr__()
 
-# %% ../../notebooks/api/02f_pds.utils.ipynb 8
+# %% ../../notebooks/api/02f_pds.utils.ipynb 16
+# marks blank or invalid fields of integer columns in the typed arrays of `RecordDecoder`
+MISSING_INT = np.iinfo(np.int64).min
+
+
+def _number_parser(convert):
+    "Field converter that gives None for blank or invalid numbers."
+
+    def parse(field):
+        try:
+            return convert(field)
+        except ValueError:
+            return None
+
+    return parse
+
+
+def _strip_field(field):
+    return field.strip(' "')
+
+
+class RecordDecoder:
+    """Record layout of a label, compiled once, to decode lines, buffers or blocks of a TAB file.
+
+    The byte slices of all fields are precomputed, array columns (ITEMS) split into one field
+    per item named like in `IndexLabel.colnames`, together with a converter per field.
+    Decoding then only slices and converts, without going back to the PVL label.
+    Single lines decode into typed named tuples, blocks of records into NumPy structured arrays.
+    Time columns stay strings, `convert_times` turns them into datetimes.
+    """
+
+    def __init__(
+        self,
+        label: IndexLabel,  # Label object that describes the record layout
+    ):
+        columns = [PVLColumn(col) for col in label.pvl_columns]
+        self.names = [name for col in columns for name in col.name_as_list]
+        self.data_types = [col.data_type for col in columns for _ in col.name_as_list]
+        self.slices = [s for col in columns for s in col.slices]
+        self.record_bytes = label.record_bytes
+        # raw bytes of the fields, for memory-mapping or viewing buffers of whole records
+        self.dtype = label.record_dtype
+        self.typed_dtype = np.dtype(
+            {
+                "names": self.names,
+                "formats": [
+                    self._typed_format(data_type, s.stop - s.start)
+                    for data_type, s in zip(self.data_types, self.slices)
+                ],
+            }
+        )
+        self.Record = namedtuple("Record", self.names, rename=True)
+        self._get_fields = itemgetter(*self.slices)
+        self._converters = [
+            _number_parser(int)
+            if data_type == "ASCII_INTEGER"
+            else _number_parser(float)
+            if data_type == "ASCII_REAL"
+            else _strip_field
+            for data_type in self.data_types
+        ]
+
+    @staticmethod
+    def _typed_format(data_type, nbytes):
+        if data_type == "ASCII_INTEGER":
+            return "i8"
+        if data_type == "ASCII_REAL":
+            return "f8"
+        return f"U{nbytes}"
+
+    def fields(
+        self,
+        line: Union[str, bytes],  # One record of the TAB file
+    ) -> tuple:  # The undecoded fields
+        fields = self._get_fields(line)
+        # itemgetter doesn't return a tuple for a single field
+        return fields if isinstance(fields, tuple) else (fields,)
+
+    def decode_line(
+        self,
+        line: Union[str, bytes],  # One record of the TAB file
+    ):  # `Record` named tuple, with None for blank or invalid numbers
+        if isinstance(line, bytes):
+            line = line.decode("latin-1")
+        return self.Record._make(
+            convert(field) for convert, field in zip(self._converters, self.fields(line))
+        )
+
+    def records(
+        self,
+        buffer,  # Bytes of whole records, e.g. read from or memory-mapping a TAB file
+    ) -> np.ndarray:  # Structured array with the raw bytes fields, without copying `buffer`
+        if isinstance(buffer, np.ndarray) and buffer.dtype == self.dtype:
+            return buffer
+        return np.frombuffer(buffer, dtype=self.dtype)
+
+    def decode_block(
+        self,
+        buffer,  # Bytes of whole records, or a structured array as returned by `records`
+    ) -> np.ndarray:  # Structured array of `typed_dtype`, with `MISSING_INT` for blank integers
+        records = self.records(buffer)
+        block = np.empty(len(records), dtype=self.typed_dtype)
+        for name, data_type in zip(self.names, self.data_types):
+            values = _decode_column(records[name], data_type)
+            if data_type == "ASCII_INTEGER" and values.dtype.kind == "f":
+                values = np.where(np.isnan(values), MISSING_INT, values)
+            block[name] = values
+        return block
+
+    def __repr__(self):
+        return f"RecordDecoder({len(self.names)} fields, {self.record_bytes} bytes per record)"
+
+# %% ../../notebooks/api/02f_pds.utils.ipynb 17
+_line_labels = {}
+
+
 def decode_line(
-    linedata: str,  # One line of a .tab data file
+    linedata: Union[str, bytes],  # One line of a .tab data file
     labelpath: Union[
-        str, Path
-    ],  # Path to the appropriate label that describes the data.
+        str, Path, IndexLabel
+    ],  # Path to the appropriate label that describes the data, or its label object.
 ):
-    "Decode one line of tabbed data with the appropriate label file."
-    label = IndexLabel(labelpath)
-    for column in label.pvl_columns:
-        pvlcol = PVLColumn(column)
-        print(pvlcol.name, pvlcol.decode(linedata))
+    """Decode one line of tabbed data with the appropriate label file.
+
+    Prints each field and returns them as `RecordDecoder.Record`.
+    The label and its decoder are reused for all lines described by the same label file.
+    """
+    label = labelpath
+    if not isinstance(label, IndexLabel):
+        path = Path(labelpath).absolute()
+        if path not in _line_labels:
+            _line_labels[path] = IndexLabel(path)
+        label = _line_labels[path]
+    record = label.decoder.decode_line(linedata)
+    for name, value in zip(label.decoder.names, record):
+        print(name, value)
+    return record
+
+# %% ../../notebooks/api/02f_pds.utils.ipynb 18
+def _coerce_mixed_column(
+    values: pd.Series,  # Column with values of mixed types
+    dtype: str = None,  # pandas dtype declared by the label, None to let pandas infer a common one
+) -> pd.Series:  # The column with one type, missing values as NA or NaT
+    if dtype is None:
+        values = values.convert_dtypes()
+        return values.astype("string") if values.dtype == object else values
+    if dtype.startswith("datetime"):
+        times = values.astype("string").to_frame()
+        return convert_times(times, [values.name], quiet=True)[values.name]
+    if dtype != "string":
+        values = pd.to_numeric(values, errors="coerce")
+    try:
+        return values.astype(dtype)
+    except (TypeError, ValueError, OverflowError):
+        return values.astype("Float64" if dtype.startswith("Int") else "string")
+
 
-# %% ../../notebooks/api/02f_pds.utils.ipynb 9
 def find_mixed_type_cols(
     # Dataframe to be searched for mixed data-types
     df: pd.DataFrame,
-    # Switch to control if NaN values in these problem columns should be replaced by the string 'UNKNOWN'
+    # Switch to control if these problem columns should be coerced to one type
     fix: bool = True,
+    # Label of the index the dataframe comes from, to coerce to its declared `dtypes`
+    label: IndexLabel = None,
+    # Only check this many randomly picked rows, for a quick scan of huge dataframes
+    sample: int = None,
 ) -> list:  # List of column names that have data type changes within themselves.
     """For a given dataframe, find the columns that are of mixed type.
 
     Tool to help with the performance warning when trying to save a pandas DataFrame as a HDF.
     When a column changes datatype somewhere, pickling occurs, slowing down the reading process of the HDF file.
+    Only object columns can hold mixed types. Their type is inferred over the whole array
+    in one call of `pandas.api.types.infer_dtype`, missing values among other values count as mixed.
+    With `fix`, the found columns are coerced to the type declared by `label`, or without
+    a label to the common type pandas infers, with missing values as NA.
     """
+    objects = df.select_dtypes("object")
+    if sample is not None and sample < len(objects):
+        objects = objects.sample(n=sample, random_state=0)
     result = []
-    for col in df.columns:
-        weird = (df[[col]].applymap(type) != df[[col]].iloc[0].apply(type)).any(axis=1)
-        if len(df[weird]) > 0:
+    for col in objects.columns:
+        values = objects[col].to_numpy()
+        kind = pd.api.types.infer_dtype(values, skipna=True)
+        if kind.startswith("mixed") or (kind != "empty" and pd.isna(values).any()):
             print(col)
             result.append(col)
     if fix is True:
+        dtypes = label.dtypes if label is not None else {}
         for col in result:
-            df[col].fillna("UNKNOWN", inplace=True)
+            df[col] = _coerce_mixed_column(df[col], dtypes.get(col))
     return result
-
-# %% ../../notebooks/api/02f_pds.utils.ipynb 10
-def fix_hirise_edrcumindex(
-    infname: Union[str, Path],  # Path to broken EDRCUMINDEX.TAB
-    outfname: Union[str, Path],  # Path where to store the fixed TAB file
-):
-    """Fix HiRISE EDRCUMINDEX.
-
-    The HiRISE EDRCUMINDEX has some broken lines where the SCAN_EXPOSURE_DURATION is of format
-    F10.4 instead of the defined F9.4.
-    This function simply replaces those incidences with one less decimal fraction, so 20000.0000
-    becomes 20000.000.
-    """
-    with Path(infname).open() as f:
-        with Path(outfname).open("w") as newf:
-            for line in tqdm(f):
-                exp = line.split(",")[21]
-                if float(exp) > 9999.999:
-                    # catching the return of write into dummy variable
-                    _ = newf.write(line.replace(exp, exp[:9]))
-                else:
-                    _ = newf.write(line)
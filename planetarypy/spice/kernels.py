@@ -9,27 +9,22 @@ __all__ = ['KERNEL_STORAGE', 'NAIF_URL', 'BASE_URL', 'datasets_url', 'datasets',
            'load_generic_kernels', 'show_loaded_kernels']
 
 # %% ../../notebooks/api/10_spice.kernels.ipynb 3
+import warnings
 import zipfile
 from datetime import timedelta
 from io import BytesIO
-from itertools import repeat
-from multiprocessing import cpu_count
 from pathlib import Path
 
 import hvplot.pandas  # noqa
 import pandas as pd
-import requests
 import spiceypy as spice
 from astropy.time import Time
-from dask.distributed import Client
 from fastcore.test import test_fail
 from fastcore.utils import store_attr
-from tqdm.auto import tqdm
-from tqdm.contrib.concurrent import process_map
 from yarl import URL
 
 from ..config import config
-from ..utils import nasa_time_to_iso, url_retrieve
+from ..utils import download_urls, get_session, nasa_time_to_iso, url_retrieve
 
 # %% ../../notebooks/api/10_spice.kernels.ipynb 5
 KERNEL_STORAGE = config.storage_root / "spice_kernels"
@@ -61,6 +56,12 @@ def is_stop_valid(
 
 # %% ../../notebooks/api/10_spice.kernels.ipynb 16
 def download_one_url(url, local_path, overwrite: bool = False):
+    "Deprecated, use `utils.download_urls` for many files or `utils.url_retrieve` for one."
+    warnings.warn(
+        "`download_one_url` is deprecated, use `utils.download_urls` or `utils.url_retrieve`.",
+        DeprecationWarning,
+        stacklevel=2,
+    )
     if local_path.exists() and not overwrite:
         return
     local_path.parent.mkdir(exist_ok=True, parents=True)
@@ -101,7 +102,7 @@ class Subsetter:
 
     @property
     def r(self):
-        return requests.get(BASE_URL, params=self.payload, stream=True)
+        return get_session().get(str(BASE_URL), params=self.payload, stream=True)
 
     @property
     def start(self):
@@ -174,40 +175,43 @@ class Subsetter:
         )
         return basepath / u.parent.name / u.name
 
-    def _non_blocking_download(self, overwrite: bool = False):
-        with Client() as client:
-            futures = []
-            for url in tqdm(self.kernel_urls, desc="Kernels downloaded"):
-                local_path = self.get_local_path(url)
-                if local_path.exists() and not overwrite:
-                    print(local_path.parent.name, local_path.name, "locally available.")
-                    continue
-                local_path.parent.mkdir(exist_ok=True, parents=True)
-                futures.append(client.submit(url_retrieve, url, local_path))
-            return [f.result() for f in futures]
-
-    def _concurrent_download(self, overwrite: bool = False):
-        paths = [self.get_local_path(url) for url in self.kernel_urls]
-        args = zip(self.kernel_urls, paths, repeat(overwrite))
-        results = process_map(download_one_url, args, max_workers=cpu_count() - 2)
-
     def download_kernels(
         self,
         overwrite: bool = False,  # switch to control if kernels should be downloaded over existing ones
-        non_blocking: bool = False,
+        non_blocking: bool = None,  # deprecated, the kernels are always downloaded concurrently
         quiet: bool = False,
     ):
-        if non_blocking:
-            return self._non_blocking_download(overwrite)
-        # sequential download
-        for url in tqdm(self.kernel_urls, desc="Kernels downloaded"):
+        """Download the kernels concurrently, capped per host, see `utils.download_urls`.
+
+        Raises ConnectionError if any kernel could not be downloaded, after all others are done.
+        """
+        if non_blocking is not None:
+            warnings.warn(
+                "`non_blocking` is deprecated, the kernels are always downloaded concurrently.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+        to_download = []
+        for url in self.kernel_urls:
             local_path = self.get_local_path(url)
             if local_path.exists() and not overwrite:
                 if not quiet:
                     print(local_path.parent.name, local_path.name, "locally available.")
                 continue
-            local_path.parent.mkdir(exist_ok=True, parents=True)
-            url_retrieve(url, local_path)
+            to_download.append((url, local_path))
+        results = download_urls(to_download, overwrite=True)
+        failed = [
+            (url, result)
+            for (url, _), result in zip(to_download, results)
+            if isinstance(result, Exception)
+        ]
+        if failed:
+            url, error = failed[0]
+            raise ConnectionError(
+                f"{len(failed)} of {len(to_download)} kernels could not be downloaded, "
+                f"e.g. {url}: {error}"
+            ) from error
+        return results
 
     def get_metakernel(self) -> Path:  # return path to metakernel file
         """Get metakernel file from NAIF and adapt path to match local storage.
@@ -240,7 +244,7 @@ def get_metakernel_and_files(
 ) -> Path:  # pathlib.Path to metakernel file with corrected data path.
     "For a given mission and start/stop times, download the kernels and get metakernel path"
     subset = Subsetter(mission, start, stop, save_location)
-    subset.download_kernels(non_blocking=True, quiet=quiet)
+    subset.download_kernels(quiet=quiet)
     return subset.get_metakernel()
 
 # %% ../../notebooks/api/10_spice.kernels.ipynb 47
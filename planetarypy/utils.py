@@ -4,25 +4,44 @@
 
 # %% auto 0
 __all__ = ['logger', 'nasa_date_format', 'nasa_dt_format', 'nasa_dt_format_with_ms', 'iso_date_format', 'iso_dt_format',
-           'iso_dt_format_with_ms', 'nasa_time_to_datetime', 'nasa_time_to_iso', 'iso_to_nasa_time',
-           'iso_to_nasa_datetime', 'replace_all_nasa_times', 'parse_http_date', 'get_remote_timestamp',
-           'check_url_exists', 'url_retrieve', 'have_internet', 'height_from_shadow', 'get_gdal_center_coords',
-           'file_variations', 'catch_isis_error']
+           'iso_dt_format_with_ms', 'session_settings', 'nasa_time_to_datetime', 'nasa_time_to_iso', 'iso_to_nasa_time',
+           'iso_to_nasa_datetime', 'nasa_times_to_datetime', 'replace_all_nasa_times', 'get_session',
+           'configure_session', 'parse_http_date', 'get_remote_timestamp', 'check_url_exists', 'url_retrieve',
+           'download_urls', 'get_url_tail', 'list_links', 'have_internet', 'file_sha256', 'DownloadManifest',
+           'download_manifest', 'is_downloaded', 'URLExistenceCache', 'url_cache', 'check_urls_exist',
+           'height_from_shadow', 'get_gdal_center_coords', 'file_variations', 'catch_isis_error']
 
 # %% ../notebooks/api/01_utils.ipynb 3
+import asyncio
 import datetime as dt
 import email.utils as eut
+import hashlib
 import http.client as httplib
 import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from html.parser import HTMLParser
 from math import radians, tan
 from pathlib import Path
 from typing import Tuple, Union
-from urllib.request import urlopen
+from urllib.parse import unquote, urljoin, urlsplit
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 from tqdm.auto import tqdm
+from urllib3.util.retry import Retry
+
+from .config import config
 
 try:
     from osgeo import gdal
@@ -139,11 +158,126 @@ def iso_to_nasa_datetime(
     date = dt.datetime.strptime(dtimestr, source_format)
     return date.strftime(target_format)
 
-# %% ../notebooks/api/01_utils.ipynb 28
+# %% ../notebooks/api/01_utils.ipynb 29
+def _char_matrix(
+    values,  # Array-like of strings
+    width: int,  # Number of characters to keep per string
+) -> Tuple[np.ndarray, np.ndarray]:  # 2D uint8 array of characters, zero padded, and the string lengths
+    "Byte matrix of the stripped strings, gathered straight from the buffers of an Arrow array."
+    arr = pa.array(values, from_pandas=True)
+    if isinstance(arr, pa.ChunkedArray):
+        arr = arr.combine_chunks()
+    if pa.types.is_dictionary(arr.type):
+        arr = arr.dictionary_decode()
+    arr = pc.utf8_trim(arr.cast(pa.large_string()), ' "Z')
+    offsets = np.frombuffer(arr.buffers()[1], dtype=np.int64)
+    offsets = offsets[arr.offset : arr.offset + len(arr) + 1]
+    lengths = np.diff(offsets)
+    lengths[arr.is_null().to_numpy(zero_copy_only=False)] = 0
+    data = arr.buffers()[2]
+    data = np.frombuffer(data, dtype=np.uint8) if data is not None else np.zeros(0, np.uint8)
+    data = np.concatenate([data, np.zeros(width, np.uint8)])  # so reading beyond the end is safe
+    chars = np.zeros((len(arr), width), dtype=np.uint8)
+    for i in range(width):
+        chars[:, i] = np.where(lengths > i, data[offsets[:-1] + i], 0)
+    return chars, lengths
+
+
+def _digits_field(
+    digits: np.ndarray,  # 2D array of characters minus ord("0")
+    start: int,  # Position of the first digit
+    ndigits: int,  # Number of digits to read
+) -> Tuple[np.ndarray, np.ndarray]:  # The integer values and a mask where all characters are digits
+    field = digits[:, start : start + ndigits].astype(np.int64)
+    ok = ((field >= 0) & (field <= 9)).all(axis=1)
+    return field @ 10 ** np.arange(ndigits - 1, -1, -1), ok
+
+
+def _time_of_day(
+    chars: np.ndarray,  # 2D uint8 array of characters
+    digits: np.ndarray,  # `chars` minus ord("0")
+    lengths: np.ndarray,  # Lengths of the strings
+    t: int,  # Position of the separator between date and time
+) -> Tuple[np.ndarray, np.ndarray]:  # Nanoseconds since midnight and a mask of valid times
+    "Parse an optional [T ]HH:MM[:SS[.f...]] time after the date."
+    has_time = lengths > t
+    has_seconds = lengths > t + 6
+    has_fraction = lengths > t + 10
+    hour, hour_ok = _digits_field(digits, t + 1, 2)
+    minute, minute_ok = _digits_field(digits, t + 4, 2)
+    second, second_ok = _digits_field(digits, t + 7, 2)
+    # zero padding beyond the string end is not a digit, so mask it out of the fraction
+    fraction = digits[:, t + 10 : t + 19].astype(np.int64)
+    fraction = np.where(np.arange(9) < (lengths - t - 10)[:, None], fraction, 0)
+    fraction_ok = ((fraction >= 0) & (fraction <= 9)).all(axis=1)
+    ok = ~has_time | (
+        ((chars[:, t] == ord("T")) | (chars[:, t] == ord(" ")))
+        # HH:MM, HH:MM:SS or HH:MM:SS.f...
+        & ((lengths == t + 6) | (lengths == t + 9) | has_fraction)
+        & (chars[:, t + 3] == ord(":"))
+        & hour_ok
+        & minute_ok
+        & (hour < 24)
+        & (minute < 60)
+        & (~has_seconds | ((chars[:, t + 6] == ord(":")) & second_ok & (second <= 60)))
+        & (~has_fraction | ((chars[:, t + 9] == ord(".")) & fraction_ok))
+    )
+    seconds = (hour * 60 + minute) * 60 + np.where(has_seconds, second, 0)
+    nanoseconds = seconds * 10**9 + np.where(has_fraction, fraction @ 10 ** np.arange(8, -1, -1), 0)
+    return np.where(has_time, nanoseconds, 0), ok
+
+
+def nasa_times_to_datetime(
+    values,  # Array-like of strings, e.g. a NumPy array or pandas Series
+) -> np.ndarray:  # datetime64[ns] array with NaT where a value couldn't be parsed
+    """Vectorized conversion of NASA and ISO date/time strings into datetime64 values.
+
+    Supports YYYY-jjj and YYYY-mm-dd dates, optionally followed by T (or a blank) and
+    HH:MM, HH:MM:SS or HH:MM:SS.f with 1 to 9 fractional digits, and a trailing Z.
+    The formats and precisions can be mixed within `values`.
+    A leap second (second 60) can't be represented by datetime64 and rolls over
+    into the next minute, e.g. "2006-12-31T23:59:60" becomes 2007-01-01T00:00:00.
+    All fields are read arithmetically from a byte matrix of the strings, without any
+    per-value Python calls.
+    """
+    chars, lengths = _char_matrix(values, 32)  # longest supported string has 29 characters
+    digits = chars.astype(np.int16) - ord("0")
+
+    year, ok = _digits_field(digits, 0, 4)
+    # the range of datetime64[ns]
+    ok &= (chars[:, 4] == ord("-")) & (year > 1677) & (year < 2262) & (lengths < 30)
+    is_iso = chars[:, 7] == ord("-")
+    doy, doy_ok = _digits_field(digits, 5, 3)
+    month, month_ok = _digits_field(digits, 5, 2)
+    day, day_ok = _digits_field(digits, 8, 2)
+    ok &= np.where(is_iso, month_ok & day_ok & (month >= 1) & (month <= 12), doy_ok)
+    first_of_year = (year - 1970).astype("datetime64[Y]")
+    first_of_month = ((year - 1970) * 12 + month - 1).astype("datetime64[M]")
+    date = np.where(
+        is_iso,
+        first_of_month.astype("datetime64[D]") + (day - 1),
+        first_of_year.astype("datetime64[D]") + (doy - 1),
+    )
+    # days beyond the end of the month or year would silently roll over
+    ok &= np.where(
+        is_iso,
+        (day >= 1) & (date.astype("datetime64[M]") == first_of_month),
+        (doy >= 1) & (date.astype("datetime64[Y]") == first_of_year),
+    )
+
+    iso_time, iso_ok = _time_of_day(chars, digits, lengths, 10)
+    nasa_time, nasa_ok = _time_of_day(chars, digits, lengths, 8)
+    ok &= np.where(is_iso, iso_ok, nasa_ok)
+    time = np.where(is_iso, iso_time, nasa_time)
+    result = date.astype("datetime64[ns]") + time.astype("timedelta64[ns]")
+    result[~ok] = np.datetime64("NaT")
+    return result
+
+# %% ../notebooks/api/01_utils.ipynb 31
 def replace_all_nasa_times(
     df: pd.DataFrame,  # DataFrame with NASA time columns
 ):
-    """Find all NASA times in dataframe and replace with ISO.
+    """Find all NASA times in dataframe and replace them with datetime64 values.
 
     Changes will be implemented on incoming dataframe!
 
@@ -151,9 +285,96 @@ def replace_all_nasa_times(
     """
     for col in [col for col in df.columns if "TIME" in col]:
         if "T" in df[col].iloc[0]:
-            df[col] = pd.to_datetime(df[col].map(nasa_time_to_iso))
+            df[col] = nasa_times_to_datetime(df[col])
+
+# %% ../notebooks/api/01_utils.ipynb 33
+# HTTP status codes of temporary server problems
+_RETRY_STATUS = [429, 500, 502, 503, 504]
+
+
+class _Session(requests.Session):
+    "Session that applies a default timeout to all requests."
+
+    timeout = None
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+# settings for the package-wide HTTP session, change them with `configure_session`
+session_settings = dict(
+    pool_size=16,  # connections kept alive per host, should cover the parallel downloads
+    timeout=(10, 60),  # seconds to connect, and to wait for data, per request
+    retries=3,  # retries of failed connections and temporary server errors, `url_retrieve` has its own
+    backoff=0.5,  # seconds to wait before the first retry, doubled for every further one
+)
+_session = None
+_download_session = None
+
+
+def _make_session(
+    retry: Retry | int,  # Retries of the adapter, 0 for none
+) -> requests.Session:
+    adapter = HTTPAdapter(
+        pool_connections=session_settings["pool_size"],
+        pool_maxsize=session_settings["pool_size"],
+        max_retries=retry,
+    )
+    session = _Session()
+    session.timeout = session_settings["timeout"]
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """The HTTP session shared by all downloads and URL checks of the package.
+
+    It keeps the connections to the few PDS hosts alive between requests, so repeated
+    requests don't pay for new TCP and TLS handshakes.
+    Requests that don't set a `timeout` get the one of `session_settings`.
+    """
+    global _session
+    if _session is None:
+        retry = Retry(
+            total=session_settings["retries"],
+            backoff_factor=session_settings["backoff"],
+            status_forcelist=_RETRY_STATUS,
+            allowed_methods=["HEAD", "GET"],
+            raise_on_status=False,  # hand the last response to the caller
+        )
+        _session = _make_session(retry)
+    return _session
+
+
+def _get_download_session() -> requests.Session:
+    """Like `get_session`, but without retries of its own.
+
+    `url_retrieve` retries the file downloads itself, resuming where the last attempt stopped,
+    so retries in the connection pool would multiply with those.
+    """
+    global _download_session
+    if _download_session is None:
+        _download_session = _make_session(0)
+    return _download_session
+
+
+def configure_session(
+    **settings,  # New values for any of the `session_settings`
+):
+    "Change the `session_settings`, used from the next request on."
+    global _session, _download_session
+    unknown = set(settings) - set(session_settings)
+    if unknown:
+        raise ValueError(f"Unknown session settings: {unknown}")
+    session_settings.update(settings)
+    for session in (_session, _download_session):
+        if session is not None:
+            session.close()
+    _session = _download_session = None
+
 
-# %% ../notebooks/api/01_utils.ipynb 30
 def parse_http_date(
     text: str,  # datestring from urllib.request
 ) -> dt.datetime:  # dt.datetime object from given datetime string
@@ -168,51 +389,370 @@ def get_remote_timestamp(
 
     Useful for checking if there's an updated file available.
     """
-    with urlopen(str(url), timeout=10) as conn:
-        t = parse_http_date(conn.headers["last-modified"])
-    return t
+    R = get_session().head(str(url), allow_redirects=True)
+    R.raise_for_status()
+    return parse_http_date(R.headers["last-modified"])
 
 
-def check_url_exists(url):
-    response = requests.head(url)
-    if response.status_code < 400:
-        return True
-    else:
-        return False
+def check_url_exists(
+    url: str,  # The URL to check
+) -> bool:
+    "True if `url` exists, checked with a HEAD request, see `check_urls_exist` for many URLs."
+    return _head_exists(str(url)) is True
+
+
+class _RetryableError(ConnectionError):
+    "A download failure that is worth another try, e.g. a dropped connection or a 503."
+
+
+def _check_status(
+    R: requests.Response,  # Response of a download request
+    url: str,  # The requested URL, for the error message
+):
+    if R.status_code in _RETRY_STATUS:
+        raise _RetryableError(f"Could not download {url}\nError code: {R.status_code}")
+    if R.status_code >= 400:
+        raise ConnectionError(f"Could not download {url}\nError code: {R.status_code}")
+
+
+def _with_retries(
+    func,  # Function doing one download attempt, picking up where the last one stopped
+    retries: int,  # Number of retries after the first attempt
+    backoff: float,  # Seconds to wait before the first retry, doubled for every further one
+):
+    for attempt in range(retries + 1):
+        try:
+            return func()
+        except (
+            _RetryableError,
+            requests.ConnectionError,
+            requests.Timeout,
+            requests.exceptions.ChunkedEncodingError,
+        ) as e:
+            if attempt == retries:
+                raise
+            wait = backoff * 2**attempt
+            logger.warning("Download failed (%s), retrying in %.1f s.", e, wait)
+            time.sleep(wait)
+
+
+class _FileHash:
+    "Running SHA256 checksum of a file while it is written, so it doesn't need to be read again."
+
+    def __init__(self):
+        self.sha = hashlib.sha256()
+        self.size = 0
+
+    def sync(
+        self,
+        path: Path,  # The file being written
+        size: int,  # Number of bytes of `path` the checksum has to cover
+    ):
+        "Only reads the file if the checksum doesn't cover `size` bytes, e.g. after a restart."
+        if self.size == size:
+            return
+        self.sha = hashlib.sha256()
+        self.size = 0
+        with open(path, "rb") as f:
+            while self.size < size:
+                chunk = f.read(min(2**20, size - self.size))
+                if not chunk:
+                    break
+                self.update(chunk)
+
+    def update(self, chunk: bytes):
+        self.sha.update(chunk)
+        self.size += len(chunk)
+
+    def hexdigest(self) -> str:
+        return self.sha.hexdigest()
+
+
+def _download_range(
+    url: str,  # The URL to download
+    partfile: Path,  # File to append the downloaded bytes to, resuming from its size
+    chunk_size: int,  # Number of bytes to read and write at a time
+    auth: HTTPBasicAuth = None,  # Authentication for the request
+    first: int = 0,  # Byte offset in the remote file where `partfile` starts
+    last: int = None,  # Last byte to download, default: until the end of the remote file
+    progress: tqdm = None,  # Progress bar to update with the downloaded bytes
+    checksum: _FileHash = None,  # Checksum to update with the written bytes
+) -> dict:  # Headers of the response, empty if there was nothing left to download
+    "Download (the rest of) a byte range of a remote file into `partfile`."
+    done = partfile.stat().st_size if partfile.exists() else 0
+    start = first + done
+    if last is not None and start > last:
+        return {}
+    # Range offsets refer to the raw bytes, so don't let the server compress
+    headers = {"Accept-Encoding": "identity"}
+    if start or last is not None:
+        headers["Range"] = f"bytes={start}-{'' if last is None else last}"
+    with _get_download_session().get(
+        url, stream=True, allow_redirects=True, auth=auth, headers=headers
+    ) as R:
+        if R.status_code == 416 and last is None:
+            # nothing left beyond `start`, if that is the size of the remote file
+            if R.headers.get("content-range", "").endswith(f"/{start}"):
+                return {}
+            partfile.unlink()  # remote file has changed, so start over
+            raise _RetryableError(f"Remote file {url} changed, restarting download.")
+        _check_status(R, url)
+        if R.status_code == 200:
+            if first or last is not None:
+                raise ConnectionError(f"Server does not support Range requests for {url}.")
+            done = 0  # server ignored the Range, so start over
+        expected = done + int(R.headers.get("content-length", 0))
+        if progress is not None and not first and last is None:
+            progress.reset(total=expected or None)
+            progress.update(done)
+        if checksum is not None:
+            checksum.sync(partfile, done)
+        with partfile.open("r+b" if done else "wb") as f:
+            f.seek(done)
+            f.truncate()
+            for chunk in R.iter_content(chunk_size=chunk_size):
+                f.write(chunk)
+                if checksum is not None:
+                    checksum.update(chunk)
+                if progress is not None:
+                    progress.update(len(chunk))
+            if f.tell() < expected:
+                raise _RetryableError(f"Download of {url} ended early.")
+        return R.headers
+
+
+def _remote_size(
+    url: str,  # The URL to check
+    auth: HTTPBasicAuth = None,  # Authentication for the request
+) -> int:  # Size of the remote file if the server supports Range requests, else 0
+    R = get_session().head(url, allow_redirects=True, auth=auth)
+    if R.status_code >= 400 or R.headers.get("accept-ranges") != "bytes":
+        return 0
+    return int(R.headers.get("content-length", 0))
+
+
+def _download_segments(
+    url: str,  # The URL to download
+    partfile: Path,  # File to join the downloaded segments in
+    size: int,  # Size of the remote file
+    n_segments: int,  # Number of byte ranges to download in parallel
+    chunk_size: int,  # Number of bytes to read and write at a time
+    auth: HTTPBasicAuth,  # Authentication for the requests
+    retries: int,  # Number of retries per segment
+    backoff: float,  # Seconds to wait before the first retry of a segment
+    progress: tqdm,  # Progress bar to update with the downloaded bytes
+    checksum: _FileHash,  # Checksum to update with the joined bytes
+) -> dict:  # Headers of the response for the first segment
+    "Download `n_segments` byte ranges into their own `.part` files in parallel, then join them."
+    bounds = np.linspace(0, size, n_segments + 1).astype(int)
+    segments = [partfile.with_name(f"{partfile.name}{i}") for i in range(n_segments)]
+    for segment in segments:
+        if segment.exists():
+            progress.update(segment.stat().st_size)
+
+    def download(i):
+        first, last = int(bounds[i]), int(bounds[i + 1]) - 1
+        return _with_retries(
+            lambda: _download_range(
+                url, segments[i], chunk_size, auth, first=first, last=last, progress=progress
+            ),
+            retries,
+            backoff,
+        )
+
+    with ThreadPoolExecutor(n_segments) as pool:
+        headers = list(pool.map(download, range(n_segments)))
+    with partfile.open("wb") as f:
+        for segment in segments:
+            with segment.open("rb") as part:
+                for chunk in iter(lambda: part.read(chunk_size), b""):
+                    f.write(chunk)
+                    checksum.update(chunk)
+            segment.unlink()
+    return headers[0]
 
 
 def url_retrieve(
     url: str,  # The URL to download
     outfile: str,  # The path where to store the downloaded file.
-    chunk_size: int = 4096,  # def chunk size for the request.iter_content call
+    chunk_size: int = 2**20,  # Number of bytes to read and write at a time
     user: str = None,  # if provided, create HTTPBasicAuth object
     passwd: str = None,  # if provided, create HTTPBasicAuth object
+    retries: int = 5,  # Number of retries after network errors or temporary server errors
+    backoff: float = 1.0,  # Seconds to wait before the first retry, doubled for every further one
+    n_segments: int = 1,  # Number of byte ranges of a big file to download in parallel
+    progress: bool = True,  # Switch to show a progress bar for this file
 ):
-    """Improved urlretrieve with progressbar, timeout and chunker.
-
-    This downloader has built-in progress bar using tqdm and using the `requests`
-    package it improves standard `urllib` behavior by adding time-out capability.
+    """Resumable urlretrieve with progressbar, timeout, retries and chunker.
 
-    I tested different chunk_sizes and most of the time 128 was actually fastest, YMMV.
+    The download goes into a `.part` file next to `outfile`, which is only renamed to
+    `outfile` when complete, and then recorded in the `download_manifest`.
+    Any retry, also in a later call, resumes the `.part` file with a HTTP Range request
+    instead of starting from byte zero.
+    With `n_segments` > 1, files of more than `n_segments` chunks are split into byte ranges
+    that are downloaded in parallel threads, each resumable on its own, if the server
+    supports Range requests.
 
     Inspired by https://stackoverflow.com/a/61575758/680232
     """
-    if user:
-        auth = HTTPBasicAuth(user, passwd)
-    else:
-        auth = None
-    R = requests.get(url, stream=True, allow_redirects=True, auth=auth)
-    if R.status_code != 200:
-        raise ConnectionError(f"Could not download {url}\nError code: {R.status_code}")
-    with tqdm.wrapattr(
-        open(outfile, "wb"),
-        "write",
+    outfile = Path(outfile)
+    partfile = outfile.with_name(outfile.name + ".part")
+    auth = HTTPBasicAuth(user, passwd) if user else None
+    size = _remote_size(url, auth) if n_segments > 1 else 0
+    checksum = _FileHash()
+    with tqdm(
+        total=size or None,
+        unit="B",
+        unit_scale=True,
         miniters=1,
-        total=int(R.headers.get("content-length", 0)),
-        desc=str(Path(outfile).name),
-    ) as fd:
-        for chunk in R.iter_content(chunk_size=chunk_size):
-            fd.write(chunk)
+        desc=outfile.name,
+        disable=not progress,
+    ) as bar:
+        if size > n_segments * chunk_size:
+            headers = _download_segments(
+                url, partfile, size, n_segments, chunk_size, auth, retries, backoff, bar, checksum
+            )
+        else:
+            headers = _with_retries(
+                lambda: _download_range(
+                    url, partfile, chunk_size, auth, progress=bar, checksum=checksum
+                ),
+                retries,
+                backoff,
+            )
+    # only reads the file if the download was complete before, e.g. a finished `.part` file
+    checksum.sync(partfile, partfile.stat().st_size)
+    partfile.replace(outfile)
+    download_manifest().record(url, outfile, headers, sha256=checksum.hexdigest())
+
+
+async def _download_urls(
+    downloads: list,  # (url, outfile) pairs
+    overwrite: bool,  # Switch to download also files that are complete locally
+    max_concurrent: int,  # Max number of downloads running at the same time
+    max_per_host: int,  # Max number of downloads from the same host at the same time
+    **kwargs,  # Passed on to `url_retrieve`
+) -> list:
+    loop = asyncio.get_running_loop()
+    slots = asyncio.Semaphore(max_concurrent)
+    host_slots = defaultdict(lambda: asyncio.Semaphore(max_per_host))
+
+    async def download(url, outfile, progress, pool):
+        outfile = Path(outfile)
+        # wait for the host first, so no global slot is blocked by a busy host
+        async with host_slots[urlsplit(str(url)).hostname], slots:
+            outfile.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                if overwrite or not await loop.run_in_executor(
+                    pool, is_downloaded, outfile, str(url)
+                ):
+                    await loop.run_in_executor(
+                        pool, partial(url_retrieve, str(url), outfile, progress=False, **kwargs)
+                    )
+                result = outfile
+            except Exception as e:
+                logger.warning("Download of %s failed: %s", url, e)
+                result = e
+        progress.update()
+        return result
+
+    with ThreadPoolExecutor(max_concurrent) as pool, tqdm(
+        total=len(downloads), desc="Files downloaded"
+    ) as progress:
+        return await asyncio.gather(
+            *(download(url, outfile, progress, pool) for url, outfile in downloads)
+        )
+
+
+def download_urls(
+    downloads,  # (url, outfile) pairs, e.g. `zip(urls, paths)`
+    overwrite: bool = False,  # Switch to download also files that are complete locally
+    max_concurrent: int = 8,  # Max number of downloads running at the same time
+    max_per_host: int = 4,  # Max number of downloads from the same host at the same time
+    **kwargs,  # Passed on to `url_retrieve`, e.g. `chunk_size` or `retries`
+) -> list:  # For each download, the local path, or the exception if it failed for good
+    """Download many files concurrently, with one progress bar for all of them.
+
+    An asyncio event loop schedules the downloads, capped in total and per host so the
+    PDS servers aren't flooded, while each transfer runs the resumable `url_retrieve` with
+    its retries in a thread, using pooled connections like `get_session`.
+    Files are skipped if they are complete according to `is_downloaded`.
+    A failed download doesn't stop the others, its exception is returned instead of the path.
+    Also works from within a running event loop, e.g. in Jupyter.
+    """
+    downloads = list(downloads)
+    coro = _download_urls(downloads, overwrite, max_concurrent, max_per_host, **kwargs)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    # asyncio.run can't be nested, so run the downloads in their own loop and thread
+    with ThreadPoolExecutor(1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+def get_url_tail(
+    url: str,  # The URL to request
+    start: int,  # Byte offset from where on to get the content
+) -> Union[bytes, None]:  # Content from `start` on, None if the server does not support Range requests
+    """Get the end of a remote file via a HTTP Range request.
+
+    Returns an empty bytes object if the remote file is not longer than `start`.
+    """
+    R = get_session().get(
+        url, headers={"Range": f"bytes={start}-"}, stream=True, allow_redirects=True
+    )
+    if R.status_code == 206:
+        return R.content
+    elif R.status_code == 416:  # range not satisfiable
+        return b""
+    elif R.status_code == 200:
+        R.close()  # don't read the whole file
+        return None
+    raise ConnectionError(f"Could not download {url}\nError code: {R.status_code}")
+
+
+class _LinkParser(HTMLParser):
+    "Collects the `href`s of all links of a HTML page."
+
+    def __init__(self):
+        super().__init__()
+        self.hrefs = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "a":
+            href = dict(attrs).get("href")
+            if href:
+                self.hrefs.append(href)
+
+
+def list_links(
+    url: str,  # URL of a web server's directory listing, e.g. of the volumes of a PDS archive
+) -> list:  # Names of the files and folders in the listing, folders with a trailing slash
+    """Get the names of the entries of a directory listing.
+
+    Only the link targets are extracted, with the standard library's streaming HTML parser,
+    which is much lighter than parsing the listing as a table.
+    Links that don't point to an entry of the listed folder, like the parent folder or
+    the sorting links, are left out.
+    """
+    url = str(url).rstrip("/") + "/"
+    R = get_session().get(url)
+    R.raise_for_status()
+    parser = _LinkParser()
+    parser.feed(R.text)
+    base = urlsplit(url)
+    names = []
+    for href in parser.hrefs:
+        target = urlsplit(urljoin(url, href))
+        if target.query or target.fragment or target.netloc != base.netloc:
+            continue
+        if not target.path.startswith(base.path):
+            continue
+        name = unquote(target.path[len(base.path) :])
+        if name and "/" not in name.rstrip("/"):
+            names.append(name)
+    return list(dict.fromkeys(names))
 
 
 def have_internet():
@@ -229,7 +769,316 @@ def have_internet():
         conn.close()
         return False
 
-# %% ../notebooks/api/01_utils.ipynb 33
+# %% ../notebooks/api/01_utils.ipynb 34
+def file_sha256(
+    path: Union[str, Path],  # File to checksum
+    chunk_size: int = 2**20,  # Number of bytes to read at a time
+) -> str:  # Hex digest of the SHA256 checksum of the file content
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+class DownloadManifest:
+    """SQLite record of the downloaded files, with their source and checksum.
+
+    `url_retrieve` stores for every completed file its URL, size, modification time,
+    the ETag and Last-Modified headers of the server and the SHA256 checksum of its content,
+    computed while the file was written. Files recorded without checksum get it with the first
+    `verify` with `full=True`.
+    Comparing the size and modification time of a file with its record finds truncated or
+    otherwise changed files with one `stat` call, without reading them, so even hundreds of
+    thousands of stored products are checked quickly. `verify` with `full=True` compares the
+    checksums instead, and `find` looks up stored files by their content.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = None,  # Path of the SQLite file, default: in `config.storage_root`
+    ):
+        if path is None:
+            path = Path(config.storage_root) / "download_manifest.sqlite"
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # shared by the threads of `download_urls`, so all access goes through the lock
+        self._con = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._con:
+            self._con.execute(
+                "CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, url TEXT, "
+                "size INTEGER, mtime_ns INTEGER, etag TEXT, last_modified TEXT, "
+                "sha256 TEXT, stored TEXT)"
+            )
+            self._con.execute("CREATE INDEX IF NOT EXISTS files_sha256 ON files (sha256)")
+
+    @staticmethod
+    def _key(path):
+        return str(Path(path).absolute())
+
+    def record(
+        self,
+        url: str,  # URL the file was downloaded from
+        path: Union[str, Path],  # The downloaded file
+        headers: dict = None,  # Response headers of the download, for ETag and Last-Modified
+        sha256: str = None,  # Checksum of the content, None to leave it to `verify` with `full=True`
+    ):
+        "Store the current state of the complete download `path`."
+        stat = Path(path).stat()
+        headers = headers or {}
+        row = (
+            self._key(path),
+            str(url),
+            stat.st_size,
+            stat.st_mtime_ns,
+            headers.get("etag"),
+            headers.get("last-modified"),
+            sha256,
+            dt.datetime.now().isoformat(),
+        )
+        with self._lock, self._con:
+            self._con.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?)", row)
+
+    def get(
+        self,
+        path: Union[str, Path],  # A downloaded file
+    ) -> Union[dict, None]:  # The record of `path`, None if there is none
+        with self._lock:
+            cursor = self._con.execute("SELECT * FROM files WHERE path = ?", (self._key(path),))
+            row = cursor.fetchone()
+        return dict(zip([d[0] for d in cursor.description], row)) if row else None
+
+    def forget(
+        self,
+        path: Union[str, Path],  # A downloaded file
+    ):
+        with self._lock, self._con:
+            self._con.execute("DELETE FROM files WHERE path = ?", (self._key(path),))
+
+    def is_intact(
+        self,
+        path: Union[str, Path],  # A downloaded file
+        url: str = None,  # If given, the file also needs to be recorded as download of `url`
+    ) -> bool:
+        "True if `path` is recorded and still has its recorded size and modification time."
+        record = self.get(path)
+        if record is None or (url is not None and record["url"] != str(url)):
+            return False
+        try:
+            stat = Path(path).stat()
+        except FileNotFoundError:
+            return False
+        return stat.st_size == record["size"] and stat.st_mtime_ns == record["mtime_ns"]
+
+    def verify(
+        self,
+        full: bool = False,  # Switch to compare checksums, which reads all files
+    ) -> list:  # (url, path) pairs of the missing or changed files, ready for `download_urls`
+        "Check all recorded files, by size and modification time or, with `full`, by checksum."
+        with self._lock:
+            rows = self._con.execute(
+                "SELECT url, path, size, mtime_ns, sha256 FROM files"
+            ).fetchall()
+        bad = []
+        for url, path, size, mtime_ns, sha256 in tqdm(rows, desc="Files verified"):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                bad.append((url, Path(path)))
+                continue
+            if full and sha256 is None:
+                # recorded without checksum, e.g. adopted by `is_downloaded`, so add it now
+                intact = stat.st_size == size and stat.st_mtime_ns == mtime_ns
+                if intact:
+                    self._set_checksum(path, file_sha256(path))
+            elif full:
+                intact = stat.st_size == size and file_sha256(path) == sha256
+            else:
+                intact = stat.st_size == size and stat.st_mtime_ns == mtime_ns
+            if not intact:
+                bad.append((url, Path(path)))
+        return bad
+
+    def _set_checksum(self, path, sha256):
+        with self._lock, self._con:
+            self._con.execute("UPDATE files SET sha256 = ? WHERE path = ?", (sha256, path))
+
+    def find(
+        self,
+        sha256: str,  # SHA256 checksum of a file content
+    ) -> list:  # Paths of the downloaded files with this content, if their checksum is known
+        with self._lock:
+            rows = self._con.execute("SELECT path FROM files WHERE sha256 = ?", (sha256,))
+            return [Path(path) for path, in rows.fetchall()]
+
+    def __len__(self):
+        with self._lock:
+            return self._con.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def __repr__(self):
+        return f"DownloadManifest({self.path}, {len(self)} files)"
+
+
+_manifest = None
+
+
+def download_manifest() -> DownloadManifest:
+    "The `DownloadManifest` in `config.storage_root`, shared by all downloads."
+    global _manifest
+    if _manifest is None:
+        _manifest = DownloadManifest()
+    return _manifest
+
+
+def is_downloaded(
+    path: Union[str, Path],  # Local path of a download
+    url: str = None,  # URL the file should come from
+) -> bool:
+    """Decide with the `download_manifest` if `path` holds a complete download, of `url` if given.
+
+    Use this instead of `path.exists()` to decide if a download can be skipped, so truncated
+    files are downloaded again. Files stored before the manifest existed are recorded if their
+    size matches the Content-Length of `url`, without `url` they count as not downloaded.
+    """
+    path = Path(path)
+    manifest = download_manifest()
+    if manifest.is_intact(path, url):
+        return True
+    if url is None or not path.exists() or manifest.get(path) is not None:
+        return False
+    R = get_session().head(str(url), allow_redirects=True)
+    if R.ok and int(R.headers.get("content-length", -1)) == path.stat().st_size:
+        manifest.record(url, path, R.headers)
+        return True
+    return False
+
+# %% ../notebooks/api/01_utils.ipynb 35
+class URLExistenceCache:
+    """SQLite cache of which remote URLs exist, with an expiry time for the results.
+
+    Checking the existence of a URL takes a HEAD request, so building file lists for
+    thousands of products is dominated by network latency. `check_urls_exist` with `cache`
+    runs the requests concurrently and stores the URLs found here, so they are reused across
+    sessions until they are older than `ttl`.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = None,  # Path of the SQLite file, default: in `config.storage_root`
+        ttl: float = 7 * 24 * 3600,  # Seconds after which a stored result expires
+    ):
+        if path is None:
+            path = Path(config.storage_root) / "url_cache.sqlite"
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self._con = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._con:
+            self._con.execute(
+                "CREATE TABLE IF NOT EXISTS urls (url TEXT PRIMARY KEY, exists_ INTEGER, checked REAL)"
+            )
+
+    def get(
+        self,
+        urls: list,  # URLs to look up
+        ttl: float = None,  # Max age of the results in seconds, default: `self.ttl`
+    ) -> dict:  # URL -> True/False for the URLs with a current result
+        ttl = self.ttl if ttl is None else ttl
+        urls = [str(url) for url in urls]
+        found = {}
+        with self._lock:
+            # stay below SQLite's limit of host parameters per query
+            for i in range(0, len(urls), 500):
+                chunk = urls[i : i + 500]
+                rows = self._con.execute(
+                    f"SELECT url, exists_ FROM urls WHERE checked > ? "
+                    f"AND url IN ({','.join('?' * len(chunk))})",
+                    [time.time() - ttl] + chunk,
+                )
+                found.update((url, bool(exists)) for url, exists in rows)
+        return found
+
+    def set(
+        self,
+        results: dict,  # URL -> True/False
+    ):
+        now = time.time()
+        with self._lock, self._con:
+            self._con.executemany(
+                "INSERT OR REPLACE INTO urls VALUES (?, ?, ?)",
+                [(str(url), int(exists), now) for url, exists in results.items()],
+            )
+
+    def clear(self):
+        with self._lock, self._con:
+            self._con.execute("DELETE FROM urls")
+
+    def __len__(self):
+        with self._lock:
+            return self._con.execute("SELECT COUNT(*) FROM urls").fetchone()[0]
+
+    def __repr__(self):
+        return f"URLExistenceCache({self.path}, {len(self)} URLs)"
+
+
+_url_cache = None
+
+
+def url_cache() -> URLExistenceCache:
+    "The `URLExistenceCache` in `config.storage_root`, shared by all cached existence checks."
+    global _url_cache
+    if _url_cache is None:
+        _url_cache = URLExistenceCache()
+    return _url_cache
+
+
+def _head_exists(url) -> Union[bool, None]:  # None if the answer is not definite
+    try:
+        response = get_session().head(url, allow_redirects=True)
+    except requests.RequestException as e:
+        logger.warning("Could not check %s: %s", url, e)
+        return None
+    if response.status_code < 400:
+        return True
+    if response.status_code < 500:
+        return False
+    logger.warning("Could not check %s: error code %s", url, response.status_code)
+    return None
+
+
+def check_urls_exist(
+    urls,  # URLs to check
+    max_concurrent: int = 16,  # Max number of HEAD requests running at the same time
+    cache: bool = False,  # Switch to use and fill the persistent `url_cache`
+    ttl: float = None,  # Max age in seconds of cached results to use, default: `url_cache().ttl`
+    refresh: bool = False,  # Switch to ignore the cached results
+) -> dict:  # URL string -> True if it exists
+    """Check the existence of many URLs concurrently.
+
+    The HEAD requests run in threads over the pooled connections of `get_session`.
+    With `cache`, only the URLs not found in the `url_cache` are requested, and the ones that
+    exist are added to it. Missing URLs are not cached, as their files may be released any
+    time, and neither are URLs that couldn't be checked due to network or server errors,
+    which count as not existing.
+    """
+    urls = list(dict.fromkeys(str(url) for url in urls))
+    results = {}
+    if cache and not refresh:
+        # skip results of older versions, which stored missing URLs too
+        results = {url: True for url, exists in url_cache().get(urls, ttl).items() if exists}
+    todo = [url for url in urls if url not in results]
+    if todo:
+        with ThreadPoolExecutor(min(max_concurrent, len(todo))) as pool:
+            checked = dict(zip(todo, pool.map(_head_exists, todo)))
+        found = {url: True for url, exists in checked.items() if exists}
+        if cache:
+            url_cache().set(found)
+        results.update(found)
+    return {url: results.get(url, False) for url in urls}
+
+# %% ../notebooks/api/01_utils.ipynb 46
 def height_from_shadow(
     shadow_in_pixels: float,  # Measured length of shadow in pixels
     sun_elev: float,  # Ange of sun over horizon in degrees
@@ -271,7 +1120,7 @@ def file_variations(
     """
     return [Path(filename).with_suffix(extension) for extension in extensions]
 
-# %% ../notebooks/api/01_utils.ipynb 39
+# %% ../notebooks/api/01_utils.ipynb 52
 def catch_isis_error(func):
     """can be used as decorator for any ISIS function"""
 
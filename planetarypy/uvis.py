@@ -12,7 +12,7 @@ from yarl import URL
 from .config import config
 from .pds.opusapi import OPUS
 from .pds.apps import get_index
-from .utils import url_retrieve
+from .utils import is_downloaded, url_retrieve
 
 # %% ../notebooks/api/05_cassini_uvis.ipynb 4
 storage_root = config.storage_root / "missions/cassini/uvis"
@@ -86,10 +86,14 @@ class DataManager:
         return self.folder / "urls.toml"
 
     def download(self, overwrite=False):
-        if self.raw_data_path.exists() and not overwrite:
+        if not self.dict and self.results_file.exists():
+            # the URLs stored by an earlier download save the OPUS query
+            self.dict = tomlkit.loads(self.results_file.read_text())
+        if not overwrite and is_downloaded(self.raw_data_path, self.raw_data_url):
             print("Local files exists. Use `overwrite=True` to download fresh.")
             return
-        self.query()
+        if not self.dict:
+            self.query()
         self.original_pid_file.mk_write(self.pid)
         self.results_file.mk_write(tomlkit.dumps(self.dict))
         self.raw_data_path.parent.mkdir(parents=True, exist_ok=True)